@@ -47,6 +47,10 @@ async def build_dashboard(user: User, db: AsyncSession) -> DashboardResponse:
             select(Skill.id, Skill.category, UserSkill.added_at)
             .join(UserSkill, UserSkill.skill_id == Skill.id)
             .where(UserSkill.user_id == user.id)
+            # Ordered at load: appending in id order below leaves every category's
+            # list already sorted, so the response needs no per-category sort. The
+            # "C" collation is bytewise, the same order Python's sorted() gave.
+            .order_by(Skill.id.collate("C"))
         )
     ).all()
 
@@ -69,8 +73,9 @@ async def build_dashboard(user: User, db: AsyncSession) -> DashboardResponse:
     return DashboardResponse(
         last_updated_from=last_updated_from,
         last_updated_at=latest.date().isoformat() if latest else None,
-        # Sort ids for a stable response; chip order within a category is cosmetic.
-        skills_by_category={cat: sorted(ids) for cat, ids in skills_by_category.items()},
+        # Ids are sorted (by the query) for a stable response; chip order within a
+        # category is cosmetic.
+        skills_by_category=skills_by_category,
     )
 
 
@@ -87,14 +92,19 @@ async def add_manual_skills(db: AsyncSession, user: User, skill_ids: list[str])
             detail=f"unknown skill ids: {unknown}",
         )
 
-    for skill_id in skill_ids:
-        # If the skill is already on the profile (either source), leave it as is.
-        statement = (
-            pg_insert(UserSkill)
-            .values(user_id=user.id, skill_id=skill_id, source="manual")
-            .on_conflict_do_nothing(index_elements=["user_id", "skill_id"])
+    # One multi-row statement. A skill already on the profile (either source), or an id
+    # repeated in the request, is left as is by DO NOTHING, so a retried save is harmless.
+    statement = (
+        pg_insert(UserSkill)
+        .values(
+            [
+                {"user_id": user.id, "skill_id": skill_id, "source": "manual"}
+                for skill_id in skill_ids
+            ]
         )
-        await db.execute(statement)
+        .on_conflict_do_nothing(index_elements=["user_id", "skill_id"])
+    )
+    await db.execute(statement)
 
 
 async def remove_manual_skills(db: AsyncSession, user: User, skill_ids: list[str]) -> None:
@@ -10,12 +10,13 @@ import uuid
 from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from sqlalchemy import Integer, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import get_current_user, get_db
 from app.models import JobPosting, JobSkill, User, UserSkill
-from app.schemas.jobs import JobMatch, skill_refs
+from app.schemas.jobs import JobMatch
+from app.schemas.skills import skill_refs
 
 router = APIRouter(tags=["jobs"])
 
@@ -36,20 +37,28 @@ async def list_jobs(
     # §9 ranking: overlap = job_skills whose skill_id the user has, most overlap first,
     # ties broken by freshest posting. LEFT JOIN so a skill-less posting still ranks (0).
     cutoff = datetime.now(UTC) - timedelta(days=RECENT_DAYS)
-    overlap = (
-        func.count(JobSkill.skill_id)
-        .filter(JobSkill.skill_id.in_(list(user_skill_ids)))
-        .label("overlap")
-    )
-    statement = (
-        select(JobPosting, overlap)
-        .outerjoin(JobSkill, JobSkill.job_id == JobPosting.id)
-        .where(JobPosting.posted_at > cutoff)
-        .group_by(JobPosting.id)
-        .order_by(overlap.desc(), JobPosting.posted_at.desc())
-        .limit(limit)
-        .offset(offset)
-    )
+    if user_skill_ids:
+        overlap = (
+            func.count(JobSkill.skill_id)
+            .filter(JobSkill.skill_id.in_(user_skill_ids))
+            .label("overlap")
+        )
+        statement = (
+            select(JobPosting, overlap)
+            .outerjoin(JobSkill, JobSkill.job_id == JobPosting.id)
+            .where(JobPosting.posted_at > cutoff)
+            .group_by(JobPosting.id)
+            .order_by(overlap.desc(), JobPosting.posted_at.desc())
+        )
+    else:
+        # No skills yet (no analysis run): every overlap is 0, so skip the join and
+        # GROUP BY entirely — the ranking is just freshest first.
+        statement = (
+            select(JobPosting, literal(0, Integer).label("overlap"))
+            .where(JobPosting.posted_at > cutoff)
+            .order_by(JobPosting.posted_at.desc())
+        )
+    statement = statement.limit(limit).offset(offset)
     rows = (await db.execute(statement)).all()
 
     skills_by_job = await _load_job_skills(db, [job.id for job, _ in rows])
@@ -74,8 +83,13 @@ async def _load_job_skills(db: AsyncSession, job_ids: list[uuid.UUID]) -> dict[u
 def _to_match(
     job: JobPosting, overlap: int, job_skill_ids: set[str], user_skill_ids: set[str]
 ) -> JobMatch:
-    matched = sorted(job_skill_ids & user_skill_ids)
-    missing = sorted(job_skill_ids - user_skill_ids)
+    # One sort and one membership probe per skill: classifying the sorted ids keeps
+    # both lists in order, instead of building and sorting an intersection and a
+    # difference separately.
+    matched: list[str] = []
+    missing: list[str] = []
+    for skill_id in sorted(job_skill_ids):
+        (matched if skill_id in user_skill_ids else missing).append(skill_id)
     return JobMatch(
         id=job.id,
         company=job.company,
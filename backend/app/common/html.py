@@ -16,10 +16,15 @@ class _TextCollector(HTMLParser):
         self._parts: list[str] = []
 
     def handle_data(self, data: str) -> None:
-        self._parts.append(data)
+        # Strip as the text arrives and keep only non-blank pieces, so text() is a
+        # single join — each node is stripped once, and the whitespace-only nodes
+        # between tags (most of them) are never stored.
+        stripped = data.strip()
+        if stripped:
+            self._parts.append(stripped)
 
     def text(self) -> str:
-        return " ".join(part.strip() for part in self._parts if part.strip())
+        return " ".join(self._parts)
 
 
 def strip_html(content: str) -> str:
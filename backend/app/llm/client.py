@@ -5,6 +5,8 @@ OpenAI SDK with:
   - tenacity retries: 3 attempts, exponential backoff 1s/2s/4s, only on transient
     errors (rate limit, timeout, connection, 5xx) — a bad request is not retried
     (§15). After the last attempt the original error propagates and the run fails.
+    The SDK's own retries are off, so these are the only ones, and each attempt is
+    capped at REQUEST_TIMEOUT_SECONDS.
   - cost accounting: usd is computed from token usage, returned on the result, logged
     with Logfire tags (§12), and — when a run_id is given — appended to the llm_calls
     ledger (app/llm/cost_ledger.py).
@@ -13,6 +15,7 @@ OpenAI SDK with:
 import time
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 
 import logfire
 from openai import (
@@ -34,6 +37,15 @@ PRICE_PER_MILLION_TOKENS = {
     "gpt-4o-mini": (0.15, 0.60),
 }
 
+# Per attempt. A project is at most 1,500 gpt-4o tokens, comfortably inside this.
+#
+# Every OpenAI client in the backend and its scripts overrides two SDK defaults. The
+# 10-minute timeout would let one stalled connection hold a run (or a script's
+# concurrency slot) far longer than any reply takes. Where tenacity wraps the call, the
+# SDK's own two retries are turned off (max_retries=0), since each tenacity attempt
+# would otherwise make up to three requests.
+REQUEST_TIMEOUT_SECONDS = 60.0
+
 # Errors worth retrying — all transient. Bad requests / auth errors are not here, so
 # they surface immediately instead of wasting three attempts.
 _RETRYABLE_ERRORS = (
@@ -128,6 +140,14 @@ def compute_cost_usd(model: str, prompt_tokens: int, completion_tokens: int) ->
     return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
 
 
+@lru_cache(maxsize=1)
 def _client() -> AsyncOpenAI:
-    """The chat client. Not cached: tests patch this to inject a fake OpenAI."""
-    return AsyncOpenAI(api_key=get_settings().openai_api_key)
+    """The chat client, built once so every call reuses its connection pool.
+
+    Lazy so importing this needs no API key; tests patch this to inject a fake OpenAI.
+    """
+    return AsyncOpenAI(
+        api_key=get_settings().openai_api_key,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+        max_retries=0,  # see REQUEST_TIMEOUT_SECONDS
+    )
@@ -15,12 +15,16 @@ from app.config import get_settings
 
 EMBEDDING_MODEL = "text-embedding-3-small"
 EMBEDDING_DIMENSIONS = 1536
+# An embedding call returns in well under a second; anything near this is a stalled
+# connection, better retried than waited on. There is no tenacity here, so the SDK's
+# own retries stay on (see app/llm/client.py, REQUEST_TIMEOUT_SECONDS).
+REQUEST_TIMEOUT_SECONDS = 15.0
 
 
 @lru_cache(maxsize=1)
 def _client() -> AsyncOpenAI:
     """The embeddings client, built once. Lazy so importing this needs no API key."""
-    return AsyncOpenAI(api_key=get_settings().openai_api_key)
+    return AsyncOpenAI(api_key=get_settings().openai_api_key, timeout=REQUEST_TIMEOUT_SECONDS)
 
 
 async def embed_text(text: str) -> list[float]:
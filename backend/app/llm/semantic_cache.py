@@ -0,0 +1,92 @@
+"""Semantic cache for LLM output on near-identical inputs (design §12 cost control).
+
+An exact-match cache misses when the same job description comes back with a trimmed
+header, a retitled role, or different whitespace — yet the generated output would be
+the same. So each entry stores the embedding of the input text next to the output,
+and a lookup reuses the most similar entry whose cosine similarity clears
+SIMILARITY_THRESHOLD.
+
+Entries live in one Redis list per partition, `semantic_cache:{partition}`, newest
+first. The caller derives the partition from everything other than the free text that
+shapes the output (model, prompt version, skill ids — see partition_key), so
+similarity only ever chooses between requests that would otherwise render the same
+prompt. A list keeps at most MAX_ENTRIES_PER_PARTITION entries and expires
+CACHE_TTL_SECONDS after its last write.
+
+Vectors are stored as base64-packed float32 rather than JSON number arrays: a lookup
+decodes up to 20 of them, and parsing 1,536 JSON floats per entry was the bulk of its
+cost (unpacking is ~10x faster, and the entry shrinks from ~40 KB to ~14 KB). float32
+is far more precision than a 0.97 cosine cutoff needs.
+
+Every function takes the Redis client, like app/guest_runs.py, so it stays testable
+against fakeredis. Failures propagate; callers decide whether to fail open.
+"""
+
+import base64
+import hashlib
+import json
+import math
+from array import array
+from collections.abc import Awaitable, Iterable, Sequence
+from typing import Any, cast
+
+import redis.asyncio as redis
+
+SIMILARITY_THRESHOLD = 0.97
+MAX_ENTRIES_PER_PARTITION = 20
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 1 week
+_KEY_PREFIX = "semantic_cache:"
+
+
+def partition_key(parts: Iterable[str]) -> str:
+    """A short, stable key for the exact (non-semantic) half of a cache lookup."""
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+async def find_similar(
+    client: redis.Redis, partition: str, embedding: list[float]
+) -> dict[str, Any] | None:
+    """The payload of the most similar cached entry, or None if none is close enough."""
+    raw_entries = await cast(
+        "Awaitable[list[str]]", client.lrange(_key(partition), 0, MAX_ENTRIES_PER_PARTITION - 1)
+    )
+    best_payload: dict[str, Any] | None = None
+    best_similarity = SIMILARITY_THRESHOLD
+    for raw in raw_entries:
+        entry = json.loads(raw)
+        similarity = _cosine(embedding, _unpack(entry["embedding"]))
+        if similarity >= best_similarity:
+            best_payload, best_similarity = entry["payload"], similarity
+    return best_payload
+
+
+async def remember(
+    client: redis.Redis, partition: str, embedding: list[float], payload: dict[str, Any]
+) -> None:
+    """Add an entry to the partition, dropping the oldest beyond the cap."""
+    key = _key(partition)
+    entry = json.dumps({"embedding": _pack(embedding), "payload": payload})
+    async with client.pipeline(transaction=True) as pipe:
+        pipe.lpush(key, entry)
+        pipe.ltrim(key, 0, MAX_ENTRIES_PER_PARTITION - 1)
+        pipe.expire(key, CACHE_TTL_SECONDS)
+        await pipe.execute()
+
+
+def _key(partition: str) -> str:
+    return f"{_KEY_PREFIX}{partition}"
+
+
+def _pack(vector: list[float]) -> str:
+    return base64.b64encode(array("f", vector).tobytes()).decode("ascii")
+
+
+def _unpack(packed: str) -> array[float]:
+    vector = array("f")
+    vector.frombytes(base64.b64decode(packed))
+    return vector
+
+
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    norms = math.sqrt(math.sumprod(a, a)) * math.sqrt(math.sumprod(b, b))
+    return math.sumprod(a, b) / norms if norms else 0.0
@@ -18,6 +18,8 @@ import argparse
 import json
 import re
 from collections import Counter
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict
 
@@ -108,7 +110,7 @@ MAX_NGRAM = 3
 
 def main() -> None:
     args = parse_args()
-    report = scan_directory(Path(args.directory), args.min_files)
+    report = scan_directory(Path(args.directory), args.min_files, args.workers)
     output_path = Path(args.output)
     output_path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
     print_summary(report, output_path)
@@ -126,14 +128,24 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--output", default="audit_report.json", help="Where to write the JSON report."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Scan files in this many processes (each loads its own matcher).",
+    )
     return parser.parse_args()
 
 
-def scan_directory(directory: Path, min_files: int) -> AuditReport:
+def scan_directory(directory: Path, min_files: int, workers: int = 1) -> AuditReport:
     """Build the audit report for every .txt file in the directory.
 
     Pure with respect to the filesystem output — it only reads. main() is the
     only thing that writes the report file.
+
+    Files are independent and scanning is CPU-bound, so workers > 1 fans them out
+    over a process pool; results are merged here in file order, so the report is
+    identical either way.
     """
     files = sorted(directory.glob("*.txt")) if directory.is_dir() else []
 
@@ -143,15 +155,12 @@ def scan_directory(directory: Path, min_files: int) -> AuditReport:
     candidate_files: dict[str, set[str]] = {}
     candidate_counts: Counter[str] = Counter()
 
-    for path in files:
-        text = path.read_text(errors="ignore")
-
-        matched_ids = extract_skill_ids(text)
+    for path, (matched_ids, candidates) in zip(files, scan_files(files, workers), strict=True):
         total_matches += len(matched_ids)
         for skill_id in matched_ids:
             matches_by_category[get_category(skill_id)] += 1
 
-        for token in find_unmatched_candidates(text):
+        for token in candidates:
             candidate_counts[token] += 1
             candidate_files.setdefault(token, set()).add(path.name)
 
@@ -177,6 +186,29 @@ def scan_directory(directory: Path, min_files: int) -> AuditReport:
     }
 
 
+def scan_files(files: list[Path], workers: int) -> Iterable[tuple[set[str], set[str]]]:
+    """(matched skill ids, unmatched candidates) for each file, in file order."""
+    if workers <= 1 or len(files) <= 1:
+        return map(scan_file, files)
+    # Imported here, not at module top: serial runs and library callers of
+    # scan_directory never need the ~17 ms of process-pool machinery.
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn, not fork: forking a process that already runs threads (logfire, sentry)
+    # can deadlock the child.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        # Several files per task so pickling overhead doesn't swamp small files.
+        chunksize = max(1, len(files) // (4 * workers))
+        return list(pool.map(scan_file, files, chunksize=chunksize))
+
+
+def scan_file(path: Path) -> tuple[set[str], set[str]]:
+    text = path.read_text(errors="ignore")
+    return extract_skill_ids(text), find_unmatched_candidates(text)
+
+
 def find_unmatched_candidates(text: str) -> set[str]:
     """Skill-shaped 1-3 word phrases in the text that the matcher did not match.
 
@@ -185,65 +217,87 @@ def find_unmatched_candidates(text: str) -> set[str]:
     """
     tokens = [token.strip("./-") for token in TOKEN_RE.findall(text)]
     tokens = [token for token in tokens if token]
+    # Classify every token once. A token sits in up to six of the 1-3 word windows
+    # below, so checking each window's tokens afresh would redo this work up to 6x.
+    is_stopword = [token.lower() in STOPWORDS for token in tokens]
+    shaped = [is_shaped_token(token) for token in tokens]
+    # A name part could belong to a multi-word technology name: capitalized or shaped.
+    name_part = [
+        is_shape or token[:1].isupper() for token, is_shape in zip(tokens, shaped, strict=True)
+    ]
 
-    flagged: list[str] = []
+    # Flagged phrases are kept as word tuples (the window itself), so the subphrase
+    # check below compares words directly instead of re-splitting every phrase string
+    # once per pair.
+    flagged: list[tuple[str, ...]] = []
     for size in range(1, MAX_NGRAM + 1):
         for start in range(len(tokens) - size + 1):
-            gram_tokens = tokens[start : start + size]
-            gram = " ".join(gram_tokens)
-            if is_skill_shaped(gram_tokens) and not extract_skill_ids(gram):
-                flagged.append(gram)
+            end = start + size
+            if not is_skill_shaped(is_stopword[start:end], shaped[start:end], name_part[start:end]):
+                continue
+            words = tuple(tokens[start:end])
+            if not is_known_phrase(" ".join(words)):
+                flagged.append(words)
 
-    return {gram for gram in flagged if not contains_shorter_candidate(gram, flagged)}
+    return {" ".join(words) for words in flagged if not contains_shorter_candidate(words, flagged)}
 
 
-def contains_shorter_candidate(gram: str, flagged: list[str]) -> bool:
-    """True if some other, shorter flagged phrase is a contiguous part of gram."""
-    gram_words = gram.split()
-    for other in flagged:
-        other_words = other.split()
-        if len(other_words) < len(gram_words) and is_subphrase(other_words, gram_words):
-            return True
-    return False
+@lru_cache(maxsize=65536)
+def is_known_phrase(gram: str) -> bool:
+    """Whether the matcher recognizes any skill in gram.
+
+    Memoized: the same phrases ("FastAPI", "AWS") recur in window after window and
+    file after file, and each check is a full normalize + FlashText pass.
+    """
+    return bool(extract_skill_ids(gram))
+
 
+def contains_shorter_candidate(gram_words: tuple[str, ...], flagged: list[tuple[str, ...]]) -> bool:
+    """True if some other, shorter flagged phrase is a contiguous part of gram_words."""
+    return any(
+        len(other_words) < len(gram_words) and is_subphrase(other_words, gram_words)
+        for other_words in flagged
+    )
 
-def is_subphrase(short_words: list[str], long_words: list[str]) -> bool:
+
+def is_subphrase(short_words: tuple[str, ...], long_words: tuple[str, ...]) -> bool:
     for start in range(len(long_words) - len(short_words) + 1):
         if long_words[start : start + len(short_words)] == short_words:
             return True
     return False
 
 
-def is_skill_shaped(gram_tokens: list[str]) -> bool:
+def is_skill_shaped(is_stopword: list[bool], shaped: list[bool], name_part: list[bool]) -> bool:
     """A single strongly-shaped token, or a title-case run with one shaped token.
 
+    Takes the per-token flags for one window (see find_unmatched_candidates).
     Excludes anything containing a stopword so ordinary English phrases like
     "with experience" never qualify.
     """
-    if any(token.lower() in STOPWORDS for token in gram_tokens):
+    if any(is_stopword):
         return False
-    if len(gram_tokens) == 1:
-        return is_shaped_token(gram_tokens[0])
-    looks_like_a_name = all(is_name_part(token) for token in gram_tokens)
-    return looks_like_a_name and any(is_shaped_token(token) for token in gram_tokens)
+    if len(shaped) == 1:
+        return shaped[0]
+    return all(name_part) and any(shaped)
 
 
+@lru_cache(maxsize=65536)
 def is_shaped_token(token: str) -> bool:
-    """The four 'this looks like a technology' heuristics."""
-    if token.lower() in DOTTED_ENGLISH:
+    """The four 'this looks like a technology' heuristics.
+
+    Memoized like is_known_phrase: prose repeats the same few thousand tokens, so
+    each distinct token is lowercased and regex-tested once per process.
+    """
+    lowered = token.lower()
+    if lowered in DOTTED_ENGLISH:
         return False
     has_internal_caps = re.search(r"[a-z][A-Z]", token) is not None  # FastAPI, PyTorch
     is_dotted = re.search(r"[A-Za-z0-9]\.[A-Za-z0-9]", token) is not None  # Node.js
     is_acronym = re.fullmatch(r"[A-Z]{2,6}", token) is not None  # AWS, ETL, GCP
-    has_tech_suffix = token.lower().endswith(TECH_SUFFIXES)
+    has_tech_suffix = lowered.endswith(TECH_SUFFIXES)
     return has_internal_caps or is_dotted or is_acronym or has_tech_suffix
 
 
-def is_name_part(token: str) -> bool:
-    """A token that could be part of a multi-word technology name."""
-    return token[:1].isupper() or is_shaped_token(token)
-
-
 def print_summary(report: AuditReport, output_path: Path) -> None:
     print(f"Scanned {report['scanned_files']} file(s).")
     if report["scanned_files"] == 0:
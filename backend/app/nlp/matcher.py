@@ -126,8 +126,16 @@ def _is_js_file_suffix(cleaned: str, start: int, end: int) -> bool:
     ".js" suffix of an unmapped framework ("D3.js" -> a spurious javascript hit).
     A standalone "JS" ("HTML / CSS / JS") is preceded by whitespace, not a dot, so
     only the dot-preceded case is rejected.
+
+    Runs once per match, so the cheap index checks go first: the slice-and-lowercase
+    (two string allocations) only happens for a two-character match after a dot.
     """
-    return cleaned[start:end].lower() == "js" and start > 0 and cleaned[start - 1] == "."
+    return (
+        end - start == 2
+        and start > 0
+        and cleaned[start - 1] == "."
+        and cleaned[start:end].lower() == "js"
+    )
 
 
 def extract_skill_ids(text: str) -> set[str]:
@@ -80,7 +80,11 @@ def validate_entry(entry: dict[str, object], category_ranks: dict[str, int]) ->
 
 @lru_cache(maxsize=1)
 def get_skill_index() -> dict[str, Skill]:
-    """Internal: id -> Skill, for O(1) lookups."""
+    """id -> Skill, for O(1) lookups. Memoized like get_all_skills.
+
+    get_skill_by_id and friends wrap this for single lookups; a caller resolving many
+    ids in a loop can fetch the dict once instead.
+    """
     return {skill.id: skill for skill in get_all_skills()}
 
 
@@ -25,9 +25,20 @@ def analyze_gap(resume_skill_ids: list[str], jd_skill_ids: list[str]) -> GapResu
     if not resume or not jd:
         raise PipelineStepError(NO_SKILLS)
 
-    matched = resume & jd
-    missing = jd - resume
-    missing_sorted = sorted(missing, key=lambda skill_id: (get_priority_rank(skill_id), skill_id))
+    # Sort the JD once, then one pass splits it into matched and missing-by-rank.
+    # Appending preserves that id order, so matched and every rank partition come out
+    # already sorted: concatenating the partitions in rank order gives the (rank, id)
+    # order with no further sorting beyond the handful of rank keys.
+    matched: list[str] = []
+    missing_by_rank: dict[int, list[str]] = {}
+    for skill_id in sorted(jd):
+        if skill_id in resume:
+            matched.append(skill_id)
+        else:
+            missing_by_rank.setdefault(get_priority_rank(skill_id), []).append(skill_id)
+    missing_sorted = [
+        skill_id for rank in sorted(missing_by_rank) for skill_id in missing_by_rank[rank]
+    ]
     fit_score = round(100 * len(matched) / len(jd))
 
-    return GapResult(matched_ids=sorted(matched), missing_ids=missing_sorted, fit_score=fit_score)
+    return GapResult(matched_ids=matched, missing_ids=missing_sorted, fit_score=fit_score)
@@ -1,7 +1,8 @@
 """Step 05 — Retrieve courses. Public entry point: run(state) -> state.
 
 Opens a DB session, retrieves the cosine-nearest course candidates for the gap, and
-stores their ids on the state.
+stores their ids on the state. An empty gap short-circuits to no candidates without
+touching the DB.
 """
 
 from app.db.engine import get_sessionmaker
@@ -12,6 +13,9 @@ from .logic import retrieve
 
 async def run(state: PipelineState) -> PipelineState:
     assert state.missing_ids is not None  # set by step 04
+    if not state.missing_ids:
+        # The resume already covers the JD: no query to embed, so skip the session too.
+        return state.model_copy(update={"retrieved_course_ids": []})
     async with get_sessionmaker()() as session:
         result = await retrieve(session, state.missing_ids)
     return state.model_copy(update=result.model_dump())
@@ -7,12 +7,16 @@ ids plus the missing skills each one covers (which step 07 uses to build project
 from app.db.engine import get_sessionmaker
 from app.pipeline_one.state import PipelineState
 
-from .logic import choose_courses
+from .logic import choose_courses, select_from_candidates
 
 
 async def run(state: PipelineState) -> PipelineState:
     assert state.retrieved_course_ids is not None  # set by step 05
     assert state.missing_ids is not None  # set by step 04
-    async with get_sessionmaker()() as session:
-        result = await choose_courses(session, state.retrieved_course_ids, state.missing_ids)
+    if not state.retrieved_course_ids:
+        # Nothing was retrieved (e.g. an empty gap): there is nothing to load.
+        result = select_from_candidates([], state.missing_ids)
+    else:
+        async with get_sessionmaker()() as session:
+            result = await choose_courses(session, state.retrieved_course_ids, state.missing_ids)
     return state.model_copy(update=result.model_dump())
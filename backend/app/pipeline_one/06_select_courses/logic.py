@@ -16,7 +16,7 @@ import uuid
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.nlp.taxonomy import get_skill_by_id
+from app.nlp.taxonomy import Skill, get_skill_index
 from app.rag.ranker import rank_courses
 from app.rag.retriever import CandidateCourse, load_candidates_by_ids
 
@@ -35,17 +35,20 @@ def select_from_candidates(
 ) -> SelectResult:
     ranked = rank_courses(candidates, missing_skill_ids)
     chosen = [entry.course for entry in ranked[:2]]
+    # The ranker already intersected each course with the gap; reuse those sets
+    # rather than rebuilding them. A fallback pick covers no exact gap skill at all
+    # (otherwise the ranker would have kept it), so it has nothing to look up.
+    covered_by_id = {entry.course.id: entry.covered for entry in ranked[:2]}
     if len(chosen) < 2:
         chosen = _fill_from_category_fallback(chosen, candidates, missing_skill_ids)
 
     course_a = chosen[0] if chosen else None
     course_b = chosen[1] if len(chosen) > 1 else None
-    missing = set(missing_skill_ids)
     return SelectResult(
         course_a_id=course_a.id if course_a else None,
         course_b_id=course_b.id if course_b else None,
-        course_a_covered=sorted(course_a.skill_ids & missing) if course_a else [],
-        course_b_covered=sorted(course_b.skill_ids & missing) if course_b else [],
+        course_a_covered=sorted(covered_by_id.get(course_a.id, ())) if course_a else [],
+        course_b_covered=sorted(covered_by_id.get(course_b.id, ())) if course_b else [],
     )
 
 
@@ -60,13 +63,16 @@ def _fill_from_category_fallback(
     no category with the gap are skipped; ties break on external_id for determinism.
     """
     already = {course.id for course in chosen}
-    gap_categories = _categories_of(missing_skill_ids)
+    # Fetched once for the whole loop rather than through get_skill_by_id per skill
+    # of every candidate.
+    skill_index = get_skill_index()
+    gap_categories = _categories_of(missing_skill_ids, skill_index)
 
     scored = []
     for candidate in candidates:
         if candidate.id in already:
             continue
-        overlap = len(gap_categories & _categories_of(candidate.skill_ids))
+        overlap = len(gap_categories & _categories_of(candidate.skill_ids, skill_index))
         if overlap == 0:
             continue
         scored.append((overlap, candidate))
@@ -80,10 +86,7 @@ def _fill_from_category_fallback(
     return filled
 
 
-def _categories_of(skill_ids: frozenset[str] | list[str]) -> set[str]:
-    categories = set()
-    for skill_id in skill_ids:
-        skill = get_skill_by_id(skill_id)
-        if skill is not None:
-            categories.add(skill.category)
-    return categories
+def _categories_of(
+    skill_ids: frozenset[str] | list[str], skill_index: dict[str, Skill]
+) -> set[str]:
+    return {skill_index[skill_id].category for skill_id in skill_ids if skill_id in skill_index}
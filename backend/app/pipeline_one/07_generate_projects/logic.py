@@ -6,18 +6,34 @@ gpt-4o calls at once with asyncio.gather. The calls are independent: if one fail
 placeholder — we only fail the whole run when BOTH fail. Cost is capped by bounding
 output tokens and tracked by the client's per-call Logfire logging (§12).
 
-Skill ids come in; only display names go into the prompt text.
+Skill ids come in; only display names go into the prompt text. The JD goes into both
+prompts, so its layout whitespace (indentation, runs of spaces, stacks of blank lines
+from a web-page paste) is compacted first — tokens the model would pay for twice and
+learn nothing from. Line breaks survive, so bullets and sections still read as such.
+It is then capped at MAX_JD_CHARS: the role, stack, and duties come first in a JD, and
+what runs past a few pages is benefits and legal boilerplate.
+
+Before calling the model we consult a semantic cache (app/llm/semantic_cache.py):
+the same skill sets plus a near-identical JD (cosine ≥ 0.97 on its embedding) reuse
+the earlier pair of projects. The cache is an optimisation only — any failure to
+read or write it is logged and the projects are generated as usual.
 """
 
 import asyncio
+import hashlib
+import re
 import uuid
 from pathlib import Path
 
+import logfire
+import redis.asyncio as redis
 from jinja2 import Environment, FileSystemLoader
 from openai.types.chat import ChatCompletionMessageParam
 
 from app.common.errors import PipelineStepError
+from app.llm import semantic_cache
 from app.llm.client import chat
+from app.llm.embeddings import embed_text
 from app.nlp.taxonomy import get_skill_by_id
 
 from .schemas import GenerateResult
@@ -25,6 +41,9 @@ from .schemas import GenerateResult
 MODEL = "gpt-4o"
 # Bounds each response, keeping two calls well under the $0.10/analysis ceiling.
 MAX_OUTPUT_TOKENS = 1500
+# ~2k tokens of JD per prompt — several times a typical posting, so only pasted-in
+# page chrome and boilerplate is ever cut. Also keeps the cache embedding in bounds.
+MAX_JD_CHARS = 8000
 
 _PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
 _env = Environment(
@@ -33,6 +52,20 @@ _env = Environment(
     trim_blocks=True,
     lstrip_blocks=True,
 )
+# Loaded once at import. Environment.get_template would hit its cache on later
+# calls, but only after re-checking the source file on disk (auto_reload).
+_FAST_APPLY_TEMPLATE = _env.get_template("project_fast_apply.j2")
+_SKILLBRIDGE_TEMPLATE = _env.get_template("project_skillbridge.j2")
+# Part of every cache partition, so editing either prompt retires old cached projects.
+_PROMPT_VERSION = hashlib.sha256(
+    b"".join(
+        (_PROMPTS_DIR / name).read_bytes()
+        for name in ("project_fast_apply.j2", "project_skillbridge.j2")
+    )
+).hexdigest()
+
+_HORIZONTAL_SPACE_RE = re.compile(r"[^\S\n]+")
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
 
 BOTH_FAILED = "we couldn't generate your projects right now — please try again."
 UNAVAILABLE_MD = (
@@ -46,19 +79,48 @@ async def generate_projects(
     jd_text: str,
     course_a_covered_ids: list[str],
     run_id: uuid.UUID | None = None,
+    cache: redis.Redis | None = None,
 ) -> GenerateResult:
+    """Generate both projects, reusing a cached pair for a near-identical request.
+
+    Pass cache=None (the default) to skip the semantic cache entirely.
+    """
+    jd_text = compact_whitespace(jd_text)[:MAX_JD_CHARS]
+    partition = semantic_cache.partition_key(
+        [MODEL, _PROMPT_VERSION, ",".join(matched_skill_ids), ",".join(course_a_covered_ids)]
+    )
+    jd_embedding: list[float] | None = None
+    if cache is not None:
+        try:
+            jd_embedding = await embed_text(jd_text)
+            cached = await semantic_cache.find_similar(cache, partition, jd_embedding)
+        except Exception as exc:  # the cache must never fail a run
+            logfire.warn("projects.cache_lookup_failed", error=repr(exc))
+            jd_embedding = cached = None
+        if cached is not None:
+            return GenerateResult.model_validate(cached)
+
     matched_names = _display_names(matched_skill_ids)
     course_names = _display_names(course_a_covered_ids)
 
-    fast_apply_prompt = _env.get_template("project_fast_apply.j2").render(
+    fast_apply_prompt = _FAST_APPLY_TEMPLATE.render(
         matched_skill_names=matched_names, jd_text=jd_text
     )
-    skillbridge_prompt = _env.get_template("project_skillbridge.j2").render(
+    skillbridge_prompt = _SKILLBRIDGE_TEMPLATE.render(
         matched_skill_names=matched_names, jd_text=jd_text, course_a_covered_names=course_names
     )
 
     project_one, project_two = await _run_both(fast_apply_prompt, skillbridge_prompt, run_id)
-    return GenerateResult(project_one_md=project_one, project_two_md=project_two)
+    result = GenerateResult(project_one_md=project_one, project_two_md=project_two)
+
+    # Only a complete pair is worth reusing; a placeholder slot should be retried.
+    complete = UNAVAILABLE_MD not in (project_one, project_two)
+    if cache is not None and jd_embedding is not None and complete:
+        try:
+            await semantic_cache.remember(cache, partition, jd_embedding, result.model_dump())
+        except Exception as exc:
+            logfire.warn("projects.cache_store_failed", error=repr(exc))
+    return result
 
 
 async def _run_both(
@@ -88,6 +150,12 @@ def _project_text(outcome: str | BaseException) -> str | None:
     return outcome if isinstance(outcome, str) else None
 
 
+def compact_whitespace(text: str) -> str:
+    """Collapse spaces/tabs to one space and blank-line runs to one blank line."""
+    lines = _HORIZONTAL_SPACE_RE.sub(" ", text).split("\n")
+    return _BLANK_LINES_RE.sub("\n\n", "\n".join(line.strip() for line in lines)).strip()
+
+
 def _display_names(skill_ids: list[str]) -> list[str]:
     names = []
     for skill_id in skill_ids:
@@ -64,14 +64,21 @@ async def _merge_extracted_skills(
     await session.execute(
         delete(UserSkill).where(UserSkill.user_id == user_id, UserSkill.source == "extracted")
     )
-    for skill_id in extracted_ids:
-        # on_conflict_do_nothing: if the user already added this skill manually, keep
-        # their manual row (the PK is (user_id, skill_id), so one row per skill).
-        await session.execute(
-            pg_insert(UserSkill)
-            .values(user_id=user_id, skill_id=skill_id, source="extracted")
-            .on_conflict_do_nothing(index_elements=["user_id", "skill_id"])
+    if not extracted_ids:
+        return
+    # One multi-row INSERT, not a statement per skill. on_conflict_do_nothing: if the
+    # user already added a skill manually, keep their manual row (the PK is
+    # (user_id, skill_id), so one row per skill).
+    await session.execute(
+        pg_insert(UserSkill)
+        .values(
+            [
+                {"user_id": user_id, "skill_id": skill_id, "source": "extracted"}
+                for skill_id in extracted_ids
+            ]
         )
+        .on_conflict_do_nothing(index_elements=["user_id", "skill_id"])
+    )
 
 
 async def persist_guest(state: PipelineState) -> None:
@@ -1,7 +1,7 @@
 """Step 03 — Extract skills. Public entry point: run(state) -> state.
 
 Runs the shared matcher over each posting's (HTML-stripped) content and stores the
-canonical skill ids per posting.
+canonical skill ids per posting, plus the stripped text itself.
 """
 
 from app.pipeline_two.state import JobsRefreshState
@@ -12,4 +12,4 @@ from .logic import extract
 async def run(state: JobsRefreshState) -> JobsRefreshState:
     assert state.filtered is not None  # set by step 02
     result = extract(state.filtered)
-    return state.model_copy(update={"skills_by_job": result.skills_by_job})
+    return state.model_copy(update=result.model_dump())
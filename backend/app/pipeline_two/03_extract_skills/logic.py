@@ -1,10 +1,14 @@
 """Step 03 logic — job content -> canonical skill ids (design §9 step 3).
 
-Strips the HTML from each posting, then runs the SAME matcher Pipeline 1 uses
+Strips the HTML from each posting (once — the text is kept for step 04's jd_text),
+then runs the SAME matcher Pipeline 1 uses
 (app/nlp/matcher.py). That shared extractor is the whole point: a resume, a JD, and a
 job posting are all reduced to the same id space, so the `/jobs` overlap score is
 meaningful. A posting that mentions no known skill gets an empty list — it's still a
 real posting and is stored (step 04) with no job_skills rows.
+
+Boards routinely post one role once per location with identical content, so the
+matcher runs once per distinct text and the ids are shared by every posting with it.
 """
 
 from app.common.html import strip_html
@@ -20,8 +24,10 @@ def job_key(posting: GreenhousePosting) -> str:
 
 
 def extract(postings: list[GreenhousePosting]) -> ExtractResult:
-    skills_by_job = {
-        job_key(posting): sorted(extract_skill_ids(strip_html(posting.content)))
-        for posting in postings
-    }
-    return ExtractResult(skills_by_job=skills_by_job)
+    text_by_job = {job_key(posting): strip_html(posting.content) for posting in postings}
+    skills_by_text: dict[str, list[str]] = {}
+    for text in text_by_job.values():
+        if text not in skills_by_text:
+            skills_by_text[text] = sorted(extract_skill_ids(text))
+    skills_by_job = {key: skills_by_text[text] for key, text in text_by_job.items()}
+    return ExtractResult(skills_by_job=skills_by_job, text_by_job=text_by_job)
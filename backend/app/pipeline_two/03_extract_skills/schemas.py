@@ -6,3 +6,5 @@ from pydantic import BaseModel
 class ExtractResult(BaseModel):
     # canonical skill ids per posting, keyed "company/gh_job_id"
     skills_by_job: dict[str, list[str]]
+    # the HTML-stripped text the skills were matched in, same keys
+    text_by_job: dict[str, str]
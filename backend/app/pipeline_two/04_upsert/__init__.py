@@ -13,6 +13,10 @@ from .logic import upsert
 async def run(state: JobsRefreshState) -> JobsRefreshState:
     assert state.filtered is not None  # set by step 02
     assert state.skills_by_job is not None  # set by step 03
+    assert state.text_by_job is not None  # set by step 03
+    if not state.filtered:
+        # A quiet cycle (nothing new in the window): nothing to write, so no session.
+        return state.model_copy(update={"upserted_count": 0})
     async with get_sessionmaker()() as session:
-        result = await upsert(session, state.filtered, state.skills_by_job)
+        result = await upsert(session, state.filtered, state.skills_by_job, state.text_by_job)
     return state.model_copy(update={"upserted_count": result.upserted_count})
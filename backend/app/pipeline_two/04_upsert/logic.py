@@ -3,63 +3,95 @@
 Each posting is upserted on its natural key (company, gh_job_id): a new posting is
 inserted, an existing one is refreshed. Then that job's job_skills are fully replaced
 (delete + re-insert) so the skill set always matches the current posting. jd_text is
-the HTML-stripped text (same stripping step 03 used for matching).
+the HTML-stripped text step 03 matched against, taken from its output rather than
+stripped again.
+
+Writes go in batches of BATCH_SIZE postings: one multi-row upsert (RETURNING each
+row's id), one delete of the batch's job_skills, and one bulk insert of their new
+rows — a few statements per batch instead of two or more round trips per posting.
 """
 
 import uuid
+from itertools import batched
 
-from sqlalchemy import delete, func
+from sqlalchemy import delete, func, insert
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.common.html import strip_html
 from app.greenhouse.client import GreenhousePosting
 from app.models import JobPosting, JobSkill
 
 from .schemas import UpsertResult
 
+# Postings per multi-row upsert. The size limit here is jd_text, not parameters: a
+# job_postings row binds its seven columns plus the generated id, but each jd_text runs
+# to several KB, so 500 postings already make a statement of a few MB. The job_skills
+# rows for the batch go in as one executemany insert.
+BATCH_SIZE = 500
+
 
 async def upsert(
     session: AsyncSession,
     postings: list[GreenhousePosting],
     skills_by_job: dict[str, list[str]],
+    text_by_job: dict[str, str],
 ) -> UpsertResult:
-    for posting in postings:
-        job_id = await _upsert_posting(session, posting)
-        await _replace_skills(session, job_id, skills_by_job.get(_job_key(posting), []))
+    # One statement can't upsert the same key twice, so collapse any repeat posting
+    # (the last one wins, as it did when each posting was its own statement).
+    unique = list({_job_key(posting): posting for posting in postings}.values())
+    for batch in batched(unique, BATCH_SIZE):
+        job_ids = await _upsert_postings(session, batch, text_by_job)
+        await _replace_skills(session, job_ids, skills_by_job)
     await session.commit()
-    return UpsertResult(upserted_count=len(postings))
+    return UpsertResult(upserted_count=len(unique))
 
 
 def _job_key(posting: GreenhousePosting) -> str:
     return f"{posting.company}/{posting.gh_job_id}"
 
 
-async def _upsert_posting(session: AsyncSession, posting: GreenhousePosting) -> uuid.UUID:
-    insert = pg_insert(JobPosting).values(
-        company=posting.company,
-        gh_job_id=posting.gh_job_id,
-        title=posting.title,
-        location=posting.location,
-        url=posting.url,
-        jd_text=strip_html(posting.content),
-        posted_at=posting.updated_at,
+async def _upsert_postings(
+    session: AsyncSession, postings: tuple[GreenhousePosting, ...], text_by_job: dict[str, str]
+) -> dict[str, uuid.UUID]:
+    """Upsert one batch of postings; return each one's row id by job key."""
+    insert_postings = pg_insert(JobPosting).values(
+        [
+            {
+                "company": posting.company,
+                "gh_job_id": posting.gh_job_id,
+                "title": posting.title,
+                "location": posting.location,
+                "url": posting.url,
+                "jd_text": text_by_job[_job_key(posting)],
+                "posted_at": posting.updated_at,
+            }
+            for posting in postings
+        ]
     )
-    statement = insert.on_conflict_do_update(
+    statement = insert_postings.on_conflict_do_update(
         index_elements=["company", "gh_job_id"],
         set_={
-            "title": insert.excluded.title,
-            "location": insert.excluded.location,
-            "url": insert.excluded.url,
-            "jd_text": insert.excluded.jd_text,
-            "posted_at": insert.excluded.posted_at,
+            "title": insert_postings.excluded.title,
+            "location": insert_postings.excluded.location,
+            "url": insert_postings.excluded.url,
+            "jd_text": insert_postings.excluded.jd_text,
+            "posted_at": insert_postings.excluded.posted_at,
             "ingested_at": func.now(),
         },
-    ).returning(JobPosting.id)
-    return (await session.execute(statement)).scalar_one()
+    ).returning(JobPosting.company, JobPosting.gh_job_id, JobPosting.id)
+    # RETURNING order isn't guaranteed to follow VALUES order, so key by natural key.
+    rows = await session.execute(statement)
+    return {f"{company}/{gh_job_id}": job_id for company, gh_job_id, job_id in rows}
 
 
-async def _replace_skills(session: AsyncSession, job_id: uuid.UUID, skill_ids: list[str]) -> None:
-    await session.execute(delete(JobSkill).where(JobSkill.job_id == job_id))
-    for skill_id in skill_ids:
-        session.add(JobSkill(job_id=job_id, skill_id=skill_id))
+async def _replace_skills(
+    session: AsyncSession, job_ids: dict[str, uuid.UUID], skills_by_job: dict[str, list[str]]
+) -> None:
+    await session.execute(delete(JobSkill).where(JobSkill.job_id.in_(list(job_ids.values()))))
+    rows = [
+        {"job_id": job_id, "skill_id": skill_id}
+        for key, job_id in job_ids.items()
+        for skill_id in skills_by_job.get(key, [])
+    ]
+    if rows:
+        await session.execute(insert(JobSkill), rows)
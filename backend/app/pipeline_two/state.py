@@ -28,6 +28,9 @@ class JobsRefreshState(BaseModel):
 
     # Step 3 (extract skills) → canonical skill ids per posting, keyed "company/gh_job_id".
     skills_by_job: dict[str, list[str]] | None = None
+    # Step 3 (extract skills) → each posting's HTML-stripped text, same keys — step 4
+    # stores it as jd_text rather than stripping the HTML a second time.
+    text_by_job: dict[str, str] | None = None
 
     # Step 4 (upsert) → how many postings were written.
     upserted_count: int | None = None
@@ -34,13 +34,18 @@ def rank_courses(
 
     Courses covering nothing are dropped — they can't be recommended for this gap.
     """
-    missing = set(missing_skill_ids)
+    # A skill's weight doesn't depend on the course — look each up once, not once per
+    # candidate that covers it.
+    weight_of = {
+        skill_id: PRIORITY_WEIGHT[get_priority_rank(skill_id)] for skill_id in missing_skill_ids
+    }
+    missing = frozenset(weight_of)  # built once; & then walks the smaller side
     ranked = []
     for candidate in candidates:
-        covered = frozenset(missing & candidate.skill_ids)
+        covered = candidate.skill_ids & missing
         if not covered:
             continue
-        score = sum(PRIORITY_WEIGHT[get_priority_rank(skill_id)] for skill_id in covered)
+        score = sum(weight_of[skill_id] for skill_id in covered)
         ranked.append(RankedCourse(candidate, score, covered))
     ranked.sort(key=_sort_key)
     return ranked
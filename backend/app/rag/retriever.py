@@ -101,11 +101,19 @@ def _build_candidates(
 async def _load_skill_sets(
     session: AsyncSession, course_ids: list[uuid.UUID]
 ) -> dict[uuid.UUID, frozenset[str]]:
-    """Fetch every course's skill set in one query, keyed by course id."""
+    """Fetch every course's skill set in one query, keyed by course id.
+
+    Selects the two columns rather than CourseSkill entities: only the ids are read,
+    so there's no reason to build an ORM object (and identity-map entry) per row.
+    """
     if not course_ids:
         return {}
-    rows = await session.scalars(select(CourseSkill).where(CourseSkill.course_id.in_(course_ids)))
+    rows = await session.execute(
+        select(CourseSkill.course_id, CourseSkill.skill_id).where(
+            CourseSkill.course_id.in_(course_ids)
+        )
+    )
     sets: dict[uuid.UUID, set[str]] = {}
-    for course_skill in rows:
-        sets.setdefault(course_skill.course_id, set()).add(course_skill.skill_id)
+    for course_id, skill_id in rows:
+        sets.setdefault(course_id, set()).add(skill_id)
     return {course_id: frozenset(skill_ids) for course_id, skill_ids in sets.items()}
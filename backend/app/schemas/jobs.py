@@ -20,13 +20,7 @@ import uuid
 
 from pydantic import BaseModel
 
-from app.nlp.taxonomy import get_skill_by_id
-
-
-class SkillRef(BaseModel):
-    id: str
-    display_name: str
-    category: str
+from app.schemas.skills import SkillRef
 
 
 class JobMatch(BaseModel):
@@ -39,14 +33,3 @@ class JobMatch(BaseModel):
     overlap: int  # skills the user has that this posting wants
     matched_skills: list[SkillRef]
     missing_skills: list[SkillRef]
-
-
-def skill_refs(skill_ids: list[str]) -> list[SkillRef]:
-    return [_skill_ref(skill_id) for skill_id in skill_ids]
-
-
-def _skill_ref(skill_id: str) -> SkillRef:
-    skill = get_skill_by_id(skill_id)
-    if skill is None:  # id not in the taxonomy (shouldn't happen for a stored job)
-        return SkillRef(id=skill_id, display_name=skill_id, category="")
-    return SkillRef(id=skill.id, display_name=skill.canonical_name, category=skill.category)
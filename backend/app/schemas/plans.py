@@ -20,13 +20,7 @@ import uuid
 from pydantic import BaseModel
 
 from app.models import Course, Plan
-from app.nlp.taxonomy import get_skill_by_id
-
-
-class SkillRef(BaseModel):
-    id: str
-    display_name: str
-    category: str
+from app.schemas.skills import SkillRef, skill_refs
 
 
 class PlanCourseRef(BaseModel):
@@ -129,7 +123,7 @@ class PlanDetail(BaseModel):
                     provider=course.platform,
                     description=course.description,
                     url=course.url,
-                    skills_covered=_skill_refs(covered),
+                    skills_covered=skill_refs(covered),
                 )
             )
 
@@ -138,20 +132,9 @@ class PlanDetail(BaseModel):
             jd_text=jd_text,
             created_at=created_at,
             fit_score=fit_score,
-            matched_skills=_skill_refs(matched_skill_ids),
-            missing_skills=_skill_refs(missing_skill_ids),
+            matched_skills=skill_refs(matched_skill_ids),
+            missing_skills=skill_refs(missing_skill_ids),
             courses=courses,
             project_one_md=project_one_md,
             project_two_md=project_two_md,
         )
-
-
-def _skill_refs(skill_ids: list[str]) -> list[SkillRef]:
-    return [_skill_ref(skill_id) for skill_id in skill_ids]
-
-
-def _skill_ref(skill_id: str) -> SkillRef:
-    skill = get_skill_by_id(skill_id)
-    if skill is None:  # id not in the taxonomy (shouldn't happen for a saved plan)
-        return SkillRef(id=skill_id, display_name=skill_id, category="")
-    return SkillRef(id=skill.id, display_name=skill.canonical_name, category=skill.category)
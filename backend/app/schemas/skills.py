@@ -0,0 +1,41 @@
+"""The skill chip shared by the plans and jobs responses.
+
+Skills go over the wire as objects {id, display_name, category}, not bare ids, so the
+UI can render a chip for any taxonomy skill without its own lookup table.
+"""
+
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict
+
+from app.nlp.taxonomy import get_all_skills
+
+
+class SkillRef(BaseModel):
+    # Frozen: one instance per skill is shared across every response (_ref_index).
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    display_name: str
+    category: str
+
+
+def skill_refs(skill_ids: list[str]) -> list[SkillRef]:
+    index = _ref_index()
+    return [index.get(skill_id) or _unknown_ref(skill_id) for skill_id in skill_ids]
+
+
+@lru_cache(maxsize=1)
+def _ref_index() -> dict[str, SkillRef]:
+    """A SkillRef per taxonomy skill, built once — a /jobs page renders hundreds of
+    chips and a plan names most skills twice, mostly the same few dozen skills, so
+    they're not rebuilt per request."""
+    return {
+        skill.id: SkillRef(id=skill.id, display_name=skill.canonical_name, category=skill.category)
+        for skill in get_all_skills()
+    }
+
+
+def _unknown_ref(skill_id: str) -> SkillRef:
+    # id not in the taxonomy (shouldn't happen for a stored plan or job)
+    return SkillRef(id=skill_id, display_name=skill_id, category="")
@@ -1,7 +1,9 @@
 """Load parsed DeepLearning.AI courses into the `courses` table.
 
 OFFLINE tooling. Reads scrapers/output/deeplearning_ai_courses.json and upserts
-each course on (platform, external_id) using the app's async engine.
+each course on (platform, external_id) using the app's async engine. Rows go in as
+multi-row INSERT … ON CONFLICT statements of up to BATCH_SIZE courses, so the whole
+corpus is a handful of round trips rather than one per course.
 
 Import direction note: the app must never import scrapers.*, but the reverse is
 fine and intended — offline jobs reach the same database through the app's models
@@ -13,6 +15,7 @@ and engine. Run after the parser, with Postgres up:
 import asyncio
 import json
 import sys
+from itertools import batched
 from pathlib import Path
 
 # Run directly as `python scrapers/load_courses.py`, which puts scrapers/ (not the
@@ -28,29 +31,41 @@ from app.models import Course  # noqa: E402
 PLATFORM = "deeplearning_ai"
 SCRAPERS_DIR = Path(__file__).resolve().parent
 DEFAULT_INPUT = SCRAPERS_DIR / "output" / "deeplearning_ai_courses.json"
+# Eight bound values per row, so a batch stays far below Postgres's 32,767-parameter
+# limit on a single statement.
+BATCH_SIZE = 500
 
 
 async def load_courses(input_path: Path) -> int:
     """Upsert every course row from the JSON file; return how many were processed."""
     rows = json.loads(input_path.read_text(encoding="utf-8"))
+    # One statement can't upsert the same key twice ("ON CONFLICT DO UPDATE command
+    # cannot affect row a second time"), so collapse repeats first — the last one
+    # wins, exactly as it did when each row was its own statement.
+    unique_rows = list({row["external_id"]: row for row in rows}.values())
     sessionmaker = get_sessionmaker()
     async with sessionmaker() as session:
-        for row in rows:
-            await session.execute(_upsert_statement(row))
+        for batch in batched(unique_rows, BATCH_SIZE):
+            await session.execute(_upsert_statement(batch))
         await session.commit()
-    return len(rows)
+    return len(unique_rows)
 
 
-def _upsert_statement(row: dict):  # type: ignore[no-untyped-def]
-    """INSERT … ON CONFLICT (platform, external_id) DO UPDATE for one course row."""
+def _upsert_statement(rows: tuple[dict, ...]):  # type: ignore[no-untyped-def]
+    """INSERT … ON CONFLICT (platform, external_id) DO UPDATE for a batch of course rows."""
     statement = pg_insert(Course).values(
-        platform=PLATFORM,
-        external_id=row["external_id"],
-        title=row["title"],
-        description=row.get("description"),
-        url=row["url"],
-        level=row.get("level"),
-        duration_hours=row.get("duration_hours"),
+        [
+            {
+                "platform": PLATFORM,
+                "external_id": row["external_id"],
+                "title": row["title"],
+                "description": row.get("description"),
+                "url": row["url"],
+                "level": row.get("level"),
+                "duration_hours": row.get("duration_hours"),
+            }
+            for row in rows
+        ]
     )
     return statement.on_conflict_do_update(
         index_elements=["platform", "external_id"],
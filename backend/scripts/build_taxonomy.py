@@ -281,33 +281,38 @@ RECALL_ALIAS_ADDITIONS = {
 }
 
 
+# A run of non-slug characters. The run already includes any "-", so one substitution
+# both replaces and collapses: no separate "-+" pass is needed.
+_NON_SLUG_RUN = re.compile(r"[^a-z0-9]+")
+
+
 def slugify(canonical_name: str) -> str:
     """Derive a stable lowercase slug id from a canonical name."""
     if canonical_name in SLUG_OVERRIDES:
         return SLUG_OVERRIDES[canonical_name]
     slug = canonical_name.lower().replace("&", "and")
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)  # runs of non-slug chars -> "-"
-    slug = re.sub(r"-+", "-", slug)  # collapse repeats
-    return slug.strip("-")
+    return _NON_SLUG_RUN.sub("-", slug).strip("-")
 
 
 def normalize_aliases(aliases: list[str]) -> list[str]:
     """Lowercase, strip, drop empties and <2-char aliases, dedupe in order."""
-    seen: list[str] = []
-    for alias in aliases:
-        cleaned = alias.strip().lower()
-        if len(cleaned) >= 2 and cleaned not in seen:
-            seen.append(cleaned)
-    return seen
+    cleaned = (alias.strip().lower() for alias in aliases)
+    # dict.fromkeys is an insertion-ordered set: O(1) dedupe, first occurrence wins.
+    return list(dict.fromkeys(alias for alias in cleaned if len(alias) >= 2))
 
 
 def merge_duplicates(raw: list[dict]) -> list[dict]:
     """Drop each merge's second entry, folding its aliases into the kept one."""
     folded_aliases: dict[str, list[str]] = {keep: [] for keep, _ in MERGES}
     to_delete = {delete for _, delete in MERGES}
+    # Index the deleted entries in one pass over raw (first occurrence wins, as a
+    # linear search would) instead of rescanning raw once per merge.
+    deleted_by_name: dict[str, dict] = {}
+    for entry in raw:
+        if entry["canonical_name"] in to_delete:
+            deleted_by_name.setdefault(entry["canonical_name"], entry)
     for keep, delete in MERGES:
-        deleted = next(e for e in raw if e["canonical_name"] == delete)
-        folded_aliases[keep] += deleted["aliases"]
+        folded_aliases[keep] += deleted_by_name[delete]["aliases"]
 
     entries = []
     for entry in raw:
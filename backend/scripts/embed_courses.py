@@ -8,6 +8,17 @@ set doesn't mean empty text, and those courses must still be retrievable.
 This is EMBED ONCE — there is no refresh cron. Default embeds only courses that
 lack a vector; --refresh re-embeds everything.
 
+Batches are independent, so up to --concurrency embedding calls are in flight at
+once; each batch is upserted and committed as it arrives, on the one DB session.
+
+A --refresh of at least DROP_INDEX_MIN_COURSES courses drops the HNSW index first
+and rebuilds it once at the end: one bulk build instead of a graph insertion per
+upserted row (pgvector's own advice for loading data). Below that, the live index is
+kept. Retrieval would run on exact scans while the index is missing, which costs more
+than a per-row insert saves on a small corpus (today's is a few hundred courses).
+The index is re-created IF NOT EXISTS on the way out of every run, including one that
+fails midway. A process killed outright is repaired by the next run.
+
     uv run python scripts/embed_courses.py
     uv run python scripts/embed_courses.py --refresh
 """
@@ -15,10 +26,10 @@ lack a vector; --refresh re-embeds everything.
 import argparse
 import asyncio
 import sys
-from collections.abc import Iterator
+from itertools import batched
 from pathlib import Path
 
-from sqlalchemy import exists, func, select
+from sqlalchemy import Row, exists, func, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -30,6 +41,15 @@ from app.models import Course, CourseEmbedding  # noqa: E402
 # OpenAI accepts thousands of inputs per request; 100 keeps each call modest.
 BATCH_SIZE = 100
 
+# Must match the index created in the course_embeddings migration.
+HNSW_INDEX = "idx_course_embeddings_hnsw"
+CREATE_HNSW_INDEX = (
+    f"CREATE INDEX IF NOT EXISTS {HNSW_INDEX} "
+    "ON course_embeddings USING hnsw (embedding vector_cosine_ops)"
+)
+# Smallest refresh worth taking the index offline for a bulk rebuild.
+DROP_INDEX_MIN_COURSES = 10_000
+
 
 def main() -> None:
     asyncio.run(run(parse_args()))
@@ -40,17 +60,31 @@ async def run(args: argparse.Namespace) -> None:
     async with sessionmaker() as session:
         courses = await load_courses_to_embed(session, args)
         print(f"{len(courses)} course(s) to embed (refresh={args.refresh}).")
-        if not courses:
-            return
+        if args.refresh and len(courses) >= DROP_INDEX_MIN_COURSES:
+            await session.execute(text(f"DROP INDEX IF EXISTS {HNSW_INDEX}"))
+            await session.commit()
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def embed(batch: tuple[Row, ...]) -> tuple[tuple[Row, ...], list[list[float]]]:
+            async with semaphore:
+                return batch, await embed_texts([course_text(course) for course in batch])
 
         embedded = 0
-        for batch in chunked(courses, BATCH_SIZE):
-            vectors = await embed_texts([course_text(course) for course in batch])
-            for course, vector in zip(batch, vectors, strict=True):
-                await upsert_embedding(session, course.id, vector)
-            await session.commit()  # persist each batch so a crash doesn't lose progress
-            embedded += len(batch)
-            print(f"  embedded {embedded}/{len(courses)}")
+        try:
+            for result in asyncio.as_completed([embed(b) for b in batched(courses, BATCH_SIZE)]):
+                batch, vectors = await result
+                for course, vector in zip(batch, vectors, strict=True):
+                    await upsert_embedding(session, course.id, vector)
+                await session.commit()  # persist each batch so a crash doesn't lose progress
+                embedded += len(batch)
+                print(f"  embedded {embedded}/{len(courses)}")
+        finally:
+            # Even when a batch fails, put the index back: retrieval must not be left on
+            # a sequential scan. Roll back first in case the failure was a DB error.
+            await session.rollback()
+            await session.execute(text(CREATE_HNSW_INDEX))
+            await session.commit()
 
     print(f"done: {embedded} course(s) embedded.")
 
@@ -61,22 +95,31 @@ def parse_args() -> argparse.Namespace:
         "--refresh", action="store_true", help="Re-embed all courses, not just the missing ones."
     )
     parser.add_argument("--limit", type=int, default=None, help="Embed only the first N courses.")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum embedding calls in flight at once (default 4).",
+    )
     return parser.parse_args()
 
 
-async def load_courses_to_embed(session, args: argparse.Namespace) -> list[Course]:  # type: ignore[no-untyped-def]
-    """Courses needing a vector: all of them with --refresh, else those lacking one."""
-    statement = select(Course)
+async def load_courses_to_embed(session, args: argparse.Namespace) -> list[Row]:  # type: ignore[no-untyped-def]
+    """Courses needing a vector: all of them with --refresh, else those lacking one.
+
+    Only the columns the embedding needs are read, not whole Course entities.
+    """
+    statement = select(Course.id, Course.title, Course.description)
     if not args.refresh:
         has_embedding = exists().where(CourseEmbedding.course_id == Course.id)
         statement = statement.where(~has_embedding)
     statement = statement.order_by(Course.title)
     if args.limit is not None:
         statement = statement.limit(args.limit)
-    return list((await session.scalars(statement)).all())
+    return list((await session.execute(statement)).all())
 
 
-def course_text(course: Course) -> str:
+def course_text(course: Row) -> str:
     """The text we embed: title plus description (description may be empty)."""
     return f"{course.title}\n\n{course.description or ''}".strip()
 
@@ -90,10 +133,5 @@ async def upsert_embedding(session, course_id, vector: list[float]) -> None:  #
     await session.execute(statement)
 
 
-def chunked(items: list[Course], size: int) -> Iterator[list[Course]]:
-    for start in range(0, len(items), size):
-        yield items[start : start + size]
-
-
 if __name__ == "__main__":
     main()
@@ -23,16 +23,28 @@ Usage:
     uv run python scripts/generate_aliases.py --dry-run --limit 50
     uv run python scripts/generate_aliases.py
     uv run python scripts/generate_aliases.py --resume
+    uv run python scripts/generate_aliases.py --workers 8
 
 Requires OPENAI_API_KEY in the environment (or in backend/.env).
 """
 
 import argparse
 import json
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import batched
 from pathlib import Path
 
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.shared_params import ResponseFormatJSONSchema
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 # build_taxonomy is the source of truth for serialization and the rebuild. We
 # reuse its render + build functions so skills.json stays byte-identical to what
@@ -50,11 +62,22 @@ ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 MODEL = "gpt-4o-mini"
 BATCH_SIZE = 25
 MAX_ALIASES_PER_ENTRY = 5
+# A full batch reply is BATCH_SIZE ids with up to MAX_ALIASES_PER_ENTRY short aliases
+# each — well under 1k tokens — so this only ever cuts off a runaway completion.
+MAX_OUTPUT_TOKENS = 2000
+REQUEST_TIMEOUT_SECONDS = 60.0
+DEFAULT_WORKERS = 4
+
+# Transient API failures are retried with backoff before a batch is given up on;
+# anything else (bad request, auth) fails the batch immediately.
+_RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
 
 # The only characters an alias may contain. Matches the matcher's tokenization
 # and the integrity test's expectations.
 ALLOWED_ALIAS_CHARS = set("abcdefghijklmnopqrstuvwxyz0123456789 .-/+#")
 
+# No output-format instructions: the per-batch response_format schema already fixes
+# the reply's shape (one alias array per id), so spelling it out would only add tokens.
 PROMPT_HEADER = """\
 For each technology below, return common case-insensitive aliases that appear in
 software-engineering resumes and job descriptions.
@@ -62,11 +85,10 @@ Rules:
   - lowercase, stripped; allowed chars: a-z 0-9 space . - / + #
   - include abbreviations (k8s->Kubernetes, tf->TensorFlow), spacing variants
     (fast api->FastAPI), dotted variants (react.js->React)
-  - EXCLUDE the canonical name itself, version numbers, file extensions, and
-    marketing taglines
+  - EXCLUDE the canonical name itself, any alias in the entry's "has" list, version
+    numbers, file extensions, and marketing taglines
   - max 5 aliases per entry; quality over quantity
   - if none are good, return an empty array
-Return STRICT JSON only: {"<id>": ["<alias>", ...], ...}
 Entries:
 """
 
@@ -79,7 +101,10 @@ def main() -> None:
     raw = json.loads(RAW_PATH.read_text())
     raw_canonicals = {entry["canonical_name"] for entry in raw}
 
-    already_done = load_done_ids() if args.resume else set()
+    # Read the audit trail once: its keys are the ids already done, and the same
+    # dict is extended in place below and written back at the end.
+    audit = load_audit() if args.resume else {}
+    already_done = set(audit)
     eligible = select_eligible(skills, raw_canonicals, already_done)
     if args.limit is not None:
         eligible = eligible[: args.limit]
@@ -98,20 +123,21 @@ def main() -> None:
         return
 
     validator = AliasValidator(skills)
-    client = OpenAI()
-    audit = load_audit() if args.resume else {}
-
-    for batch_num, batch in enumerate(chunked(eligible, BATCH_SIZE), start=1):
-        print(f"  batch {batch_num}: {len(batch)} entries...", flush=True)
-        suggestions = call_model(client, batch)
-        for entry in batch:
-            proposed = suggestions.get(entry["id"], [])
-            accepted, rejected = validator.review(entry, proposed)
-            audit[entry["id"]] = {
-                "canonical": entry["canonical_name"],
-                "accepted": accepted,
-                "rejected": rejected,
-            }
+    # Timeout and max_retries=0 as in app/llm/client.py; _call_llm retries via tenacity.
+    client = OpenAI(timeout=REQUEST_TIMEOUT_SECONDS, max_retries=0)
+
+    # The batches are independent network calls, so they run on a thread pool (the
+    # sync client is thread-safe). map() yields in submission order, so review
+    # below still sees the batches in the same order as a serial run and the
+    # validator's cross-batch collision checks stay deterministic.
+    batches = list(batched(eligible, BATCH_SIZE))
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        replies = executor.map(lambda batch: call_model(client, batch), batches)
+        for batch_num, (batch, suggestions) in enumerate(
+            zip(batches, replies, strict=True), start=1
+        ):
+            print(f"  batch {batch_num}: {len(batch)} entries...", flush=True)
+            review_batch(validator, batch, suggestions, audit)
 
     total_accepted = sum(len(rec["accepted"]) for rec in audit.values())
     print(f"Generated {total_accepted} accepted aliases across {len(audit)} entries.")
@@ -145,6 +171,12 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--resume", action="store_true", help="Skip entries already present in the audit trail."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Batches in flight at once (default {DEFAULT_WORKERS}).",
+    )
     return parser.parse_args()
 
 
@@ -218,37 +250,80 @@ def count_non_raw_eligible(skills: list[dict], raw_canonicals: set[str], done: s
 # --- Calling the model ------------------------------------------------------
 
 
-def call_model(client: OpenAI, batch: list[dict]) -> dict[str, list[str]]:
+def call_model(client: OpenAI, batch: tuple[dict, ...]) -> dict[str, list[str]]:
     """Ask gpt-4o-mini for aliases for one batch. Returns {id: [alias, ...]}.
 
-    A batch that errors or returns unparseable JSON yields no suggestions rather
-    than aborting the whole run — the other batches still land.
+    Rate limits and 5xx are retried with backoff inside _call_llm. A batch that
+    still errors or returns unparseable JSON yields no suggestions rather than
+    aborting the whole run — the other batches still land.
     """
     prompt = build_prompt(batch)
     try:
-        response = client.chat.completions.create(
-            model=MODEL,
-            temperature=0,
-            response_format={"type": "json_object"},
-            messages=[{"role": "user", "content": prompt}],
+        data: dict[str, list[str]] = json.loads(
+            _call_llm(client, prompt, build_response_format(batch))
         )
-        data = json.loads(response.choices[0].message.content or "{}")
     except Exception as error:  # noqa: BLE001 — one bad batch must not kill the run
         print(f"    batch failed ({error}); skipping its entries.", file=sys.stderr)
         return {}
+    return data
+
+
+@retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential(multiplier=1, min=2, max=30),
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+    reraise=True,
+)
+def _call_llm(client: OpenAI, prompt: str, response_format: ResponseFormatJSONSchema) -> str:
+    response = client.chat.completions.create(
+        model=MODEL,
+        temperature=0,
+        max_tokens=MAX_OUTPUT_TOKENS,
+        response_format=response_format,
+        messages=[{"role": "user", "content": prompt}],
+    )
+    return response.choices[0].message.content or "{}"
 
-    if not isinstance(data, dict):
-        print("    batch returned non-object JSON; skipping.", file=sys.stderr)
-        return {}
-    return {str(k): v for k, v in data.items() if isinstance(v, list)}
 
+def build_response_format(batch: tuple[dict, ...]) -> ResponseFormatJSONSchema:
+    """Structured outputs: exactly one alias array per id in the batch, nothing else.
 
-def build_prompt(batch: list[dict]) -> str:
-    lines = [
-        f'  - id: "{entry["id"]}", canonical: "{entry["canonical_name"]}", '
-        f'category: "{entry["category"]}"'
-        for entry in batch
-    ]
+    The API enforces the schema while decoding, so a reply always parses and always
+    has this batch's ids as its keys — no shape checks needed on our side.
+    """
+    ids = [entry["id"] for entry in batch]
+    alias_array = {"type": "array", "items": {"type": "string"}}
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": "aliases",
+            "strict": True,
+            "schema": {
+                "type": "object",
+                "properties": {skill_id: alias_array for skill_id in ids},
+                "required": ids,
+                "additionalProperties": False,
+            },
+        },
+    }
+
+
+def build_prompt(batch: tuple[dict, ...]) -> str:
+    """The header plus one line per entry.
+
+    An entry that already has an alias lists it under "has", so the model spends its
+    output on new aliases instead of re-proposing ones review() would just dedupe. The
+    list is dumped without spaces after its commas; the model doesn't need them.
+    """
+    lines = []
+    for entry in batch:
+        line = (
+            f'  - id: "{entry["id"]}", canonical: "{entry["canonical_name"]}", '
+            f'category: "{entry["category"]}"'
+        )
+        if entry.get("aliases"):
+            line += f", has: {json.dumps(entry['aliases'], separators=(',', ':'))}"
+        lines.append(line)
     return PROMPT_HEADER + "\n".join(lines)
 
 
@@ -315,6 +390,23 @@ class AliasValidator:
         return None
 
 
+def review_batch(
+    validator: AliasValidator,
+    batch: tuple[dict, ...],
+    suggestions: dict[str, list[str]],
+    audit: dict,
+) -> None:
+    """Run one batch's suggestions through the validator and record them in the audit."""
+    for entry in batch:
+        proposed = suggestions.get(entry["id"], [])
+        accepted, rejected = validator.review(entry, proposed)
+        audit[entry["id"]] = {
+            "canonical": entry["canonical_name"],
+            "accepted": accepted,
+            "rejected": rejected,
+        }
+
+
 # --- Writing results --------------------------------------------------------
 
 
@@ -341,7 +433,8 @@ def rebuild_skills_json() -> None:
 
 
 def snapshot_skills() -> None:
-    BACKUP_PATH.write_text(SKILLS_PATH.read_text())
+    # A byte copy: no decode/re-encode of the whole taxonomy just to duplicate it.
+    shutil.copyfile(SKILLS_PATH, BACKUP_PATH)
     print(f"Snapshot: {SKILLS_PATH} -> {BACKUP_PATH}")
 
 
@@ -355,14 +448,5 @@ def load_audit() -> dict:
     return {}
 
 
-def load_done_ids() -> set[str]:
-    return set(load_audit().keys())
-
-
-def chunked(items: list, size: int):
-    for start in range(0, len(items), size):
-        yield items[start : start + size]
-
-
 if __name__ == "__main__":
     main()
@@ -9,23 +9,44 @@ produces — so course retrieval and gap analysis score against the same vocabul
 
     uv run python scripts/map_course_skills.py --dry-run --limit 10
     uv run python scripts/map_course_skills.py            # full run
+    uv run python scripts/map_course_skills.py --batch    # full run via the Batch API
 
 PRECISION is the whole point: a falsely-claimed skill makes a course win
 gap-coverage it shouldn't and misdirects the recommendation. The prompt forbids
 "mentioned in passing" skills, temperature is 0, and unknown ids are dropped.
+
+Because temperature is 0, a reply is a pure function of the model, the system prompt,
+and the course text — so raw replies are cached on disk under scripts/.cache/, keyed
+by a hash of exactly those. A full run after a --dry-run, or a re-run after a crash,
+re-asks only for courses whose text or prompt changed. Cached replies are still
+validated against the CURRENT taxonomy. --no-cache forces fresh calls.
+
+Courses are independent, so up to --concurrency model calls are in flight at once;
+each reply is validated and written as it arrives, on the one DB session.
+
+--batch sends every uncached course through the OpenAI Batch API instead: one JSONL
+upload, half the per-token price, and results within the 24h completion window (the
+script polls until the batch finishes). Replies land in the same disk cache, so the
+mapping loop then reads them from there; a request the batch failed falls back to a
+normal call.
 """
 
 import argparse
 import asyncio
+import hashlib
 import json
 import re
 import sys
+import time
 import uuid
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from openai import AsyncOpenAI
-from sqlalchemy import delete, exists, or_, select
+from openai import AsyncOpenAI, ContentFilterFinishReasonError, LengthFinishReasonError
+from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
+from pydantic import BaseModel, ConfigDict, ValidationError
+from sqlalchemy import delete, exists, or_, select, text
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -40,6 +61,27 @@ from app.nlp.taxonomy import get_all_skills, get_surface_to_id_map  # noqa: E402
 _PAREN_SUFFIX = re.compile(r"\s*\(.*\)\s*$")
 
 MODEL = "gpt-4o-mini"
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "course_skills"
+# The system prompt (instructions + the ~1k-line allowed id list) is byte-identical on
+# every call and always sent first, with the short per-course text last, so OpenAI's
+# prompt caching serves it from cache at a discount. A fixed cache key routes every
+# call of a run to the same cache shard, so those hits don't depend on luck.
+PROMPT_CACHE_KEY = "map_course_skills"
+# A reply is a short id list — even a broad course maps to a dozen or so ids — so this
+# bounds a runaway completion without ever truncating a real one.
+MAX_OUTPUT_TOKENS = 400
+# A 400-token reply takes seconds, so anything near this is a stalled connection
+# (timeout and retry defaults: see app/llm/client.py, REQUEST_TIMEOUT_SECONDS).
+REQUEST_TIMEOUT_SECONDS = 30.0
+# --batch moves one JSONL file each way, carrying the system prompt once per course —
+# megabytes, not a short reply — so those two transfers get a longer ceiling.
+BATCH_FILE_TIMEOUT_SECONDS = 300.0
+# The Batch API calls have no tenacity wrapper, so unlike map_course they keep the
+# SDK's own retries.
+BATCH_MAX_RETRIES = 2
+BATCH_POLL_SECONDS = 60
+# Terminal Batch API statuses; anything else is still queued or running.
+_BATCH_DONE_STATUSES = {"completed", "failed", "expired", "cancelled"}
 
 SYSTEM_PROMPT_TEMPLATE = """\
 You are mapping a course to the technical skills it SUBSTANTIALLY TEACHES.
@@ -68,6 +110,19 @@ class CourseRow:
     description: str | None
 
 
+class SkillIdsReply(BaseModel):
+    """The model's reply, and the structured-outputs schema the API enforces for it.
+
+    The SDK derives a strict JSON schema from this model, so a reply always has
+    exactly this shape and arrives already parsed. Also the disk-cache entry format,
+    and (via model_json_schema) the schema sent with --batch requests.
+    """
+
+    model_config = ConfigDict(extra="forbid")  # strict schemas need additionalProperties: false
+
+    skill_ids: list[str]
+
+
 @dataclass
 class Mapping:
     course: CourseRow
@@ -83,18 +138,37 @@ async def run(args: argparse.Namespace) -> None:
     valid_ids = {skill.id for skill in get_all_skills()}
     surface_map = get_surface_to_id_map()  # alias/canonical surface -> id, like the matcher
     system_prompt = build_system_prompt()
-    client = AsyncOpenAI(api_key=get_settings().openai_api_key)
+    client = AsyncOpenAI(
+        api_key=get_settings().openai_api_key, timeout=REQUEST_TIMEOUT_SECONDS, max_retries=0
+    )
     sessionmaker = get_sessionmaker()
 
     async with sessionmaker() as session:
         courses = await load_courses(session, args)
         print(f"{len(courses)} course(s) to map (model={MODEL}, dry_run={args.dry_run}).")
 
-        mappings: list[Mapping] = []
-        for index, course in enumerate(courses, start=1):
-            proposed = await map_course(client, system_prompt, course)
+        refreshed: set[str] = set()
+        if args.batch:
+            refreshed = await prefetch_with_batch(client, system_prompt, courses, args.no_cache)
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def propose(position: int, course: CourseRow) -> tuple[int, list[str]]:
+            # A reply the batch just stored is fresh; any other still honors --no-cache.
+            no_cache = (
+                args.no_cache and reply_cache_path(system_prompt, course).stem not in refreshed
+            )
+            async with semaphore:
+                return position, await fetch_reply(client, system_prompt, course, no_cache)
+
+        # Replies finish in any order; keyed by position so the report follows course order.
+        mappings: dict[int, Mapping] = {}
+        replies = asyncio.as_completed([propose(p, course) for p, course in enumerate(courses)])
+        for index, reply in enumerate(replies, start=1):
+            position, proposed = await reply
+            course = courses[position]
             accepted, dropped = resolve_ids(proposed, valid_ids, surface_map)
-            mappings.append(Mapping(course, accepted, dropped))
+            mappings[position] = Mapping(course, accepted, dropped)
             print(
                 f"  [{index}/{len(courses)}] {course.external_id}: {accepted}"
                 + (f"  DROPPED {dropped}" if dropped else "")
@@ -103,7 +177,7 @@ async def run(args: argparse.Namespace) -> None:
                 await replace_course_skills(session, course.id, accepted)
                 await session.commit()  # persist per course so progress survives a crash
 
-    report(mappings, args)
+    report([mappings[position] for position in sorted(mappings)], args)
 
 
 def parse_args() -> argparse.Namespace:
@@ -120,6 +194,23 @@ def parse_args() -> argparse.Namespace:
         help="Map only these courses (one or more comma-separated UUIDs or "
         "external_ids), re-mapping even if already done. Useful for dry-run samples.",
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Maximum model calls in flight at once (default 8).",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Send uncached courses through the Batch API (half price, up to 24h) "
+        "and wait for it to finish.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached replies and ask the model again (the cache is still refreshed).",
+    )
     return parser.parse_args()
 
 
@@ -139,21 +230,152 @@ def resolve_ids(
     is a known alias/canonical name (e.g. "llms" -> "large-language-models").
     Anything else is a hallucination: dropped and returned for logging.
     """
-    accepted: list[str] = []
+    accepted: dict[str, None] = {}  # insertion-ordered set: first mention wins
     dropped: list[str] = []
     for token in proposed:
-        normalized = _PAREN_SUFFIX.sub("", token).strip().lower()
+        normalized = _normalize_token(token)
         skill_id = normalized if normalized in valid_ids else surface_map.get(normalized)
         if skill_id is None:
             dropped.append(token)
-        elif skill_id not in accepted:
-            accepted.append(skill_id)
-    return accepted, dropped
+        else:
+            accepted.setdefault(skill_id)
+    return list(accepted), dropped
+
+
+@lru_cache(maxsize=4096)
+def _normalize_token(token: str) -> str:
+    # Replies draw from one ~1.1k-id vocabulary, so the same tokens recur across
+    # hundreds of courses; normalize each distinct one once.
+    return _PAREN_SUFFIX.sub("", token).strip().lower()
+
+
+async def fetch_reply(
+    client: AsyncOpenAI, system_prompt: str, course: CourseRow, no_cache: bool
+) -> list[str]:
+    """The model's raw id list for a course, from the disk cache when possible."""
+    cache_path = reply_cache_path(system_prompt, course)
+    cached = None if no_cache else load_cached_reply(cache_path)
+    if cached is not None:
+        return cached
+    proposed = await map_course(client, system_prompt, course)
+    store_cached_reply(cache_path, proposed)
+    return proposed
+
+
+async def prefetch_with_batch(
+    client: AsyncOpenAI, system_prompt: str, courses: list[CourseRow], no_cache: bool
+) -> set[str]:
+    """Fetch every uncached reply with one Batch API job and store it in the disk cache.
+
+    Each request's custom_id is its cache file's name, so identical courses share one
+    request and results join straight back to their cache entries. Returns the names
+    of the entries it stored; a request that failed, or a batch that produced no
+    output, leaves any older entry in place, so the caller must not treat it as fresh.
+    """
+    pending: dict[str, CourseRow] = {}
+    for course in courses:
+        cache_path = reply_cache_path(system_prompt, course)
+        if no_cache or load_cached_reply(cache_path) is None:
+            pending.setdefault(cache_path.stem, course)
+    if not pending:
+        print("--batch: every reply is already cached.")
+        return set()
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    **_request_params(system_prompt, course),
+                    "response_format": {
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": SkillIdsReply.__name__,
+                            "schema": SkillIdsReply.model_json_schema(),
+                            "strict": True,
+                        },
+                    },
+                },
+            },
+            ensure_ascii=False,
+        )
+        for custom_id, course in pending.items()
+    ]
+    batch_client = client.with_options(max_retries=BATCH_MAX_RETRIES)
+    file_client = batch_client.with_options(timeout=BATCH_FILE_TIMEOUT_SECONDS)
+    upload = await file_client.files.create(
+        file=("requests.jsonl", "\n".join(lines).encode()), purpose="batch"
+    )
+    batch = await batch_client.batches.create(
+        input_file_id=upload.id, endpoint="/v1/chat/completions", completion_window="24h"
+    )
+    print(f"--batch: submitted {len(pending)} request(s) as {batch.id}; polling...")
+
+    started = time.monotonic()
+    while batch.status not in _BATCH_DONE_STATUSES:
+        await asyncio.sleep(BATCH_POLL_SECONDS)
+        batch = await batch_client.batches.retrieve(batch.id)
+        print(f"  {batch.status} after {(time.monotonic() - started) / 60:.0f} min")
+    if batch.output_file_id is None:
+        print(f"--batch: {batch.id} ended {batch.status} with no output; calling directly.")
+        return set()
+
+    output = await file_client.files.content(batch.output_file_id)
+    stored: set[str] = set()
+    for line in output.text.splitlines():
+        result = json.loads(line)
+        response = result.get("response") or {}
+        if response.get("status_code") != 200:
+            continue  # errored request: not refreshed, so the loop asks for it directly
+        skill_ids = _batch_reply_ids(ChatCompletion.model_validate(response["body"]))
+        store_cached_reply(CACHE_DIR / f"{result['custom_id']}.json", skill_ids)
+        stored.add(result["custom_id"])
+    print(f"--batch: cached {len(stored)} of {len(pending)} replies.")
+    return stored
+
+
+def _batch_reply_ids(completion: ChatCompletion) -> list[str]:
+    """The id list in a Batch API completion, mirroring map_course's edge cases."""
+    choice = completion.choices[0]
+    if choice.finish_reason in ("length", "content_filter") or choice.message.refusal:
+        return []
+    try:
+        return SkillIdsReply.model_validate_json(choice.message.content or "").skill_ids
+    except ValidationError:
+        return []
+
+
+def reply_cache_path(system_prompt: str, course: CourseRow) -> Path:
+    """Where the model's reply for this exact (model, prompt, course text) is cached."""
+    key_source = json.dumps(
+        [MODEL, system_prompt, course.title, course.description or ""], ensure_ascii=False
+    )
+    return CACHE_DIR / f"{hashlib.sha256(key_source.encode()).hexdigest()}.json"
+
+
+def load_cached_reply(path: Path) -> list[str] | None:
+    if not path.exists():
+        return None
+    try:
+        return SkillIdsReply.model_validate_json(path.read_bytes()).skill_ids
+    except ValidationError:
+        return None  # a truncated/corrupt entry is just a miss
+
+
+def store_cached_reply(path: Path, skill_ids: list[str]) -> None:
+    """Write an entry atomically: a run killed mid-write never leaves a partial file
+    behind, and a concurrent reader sees either the old entry or the new one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp")  # unique per writer
+    partial.write_text(SkillIdsReply(skill_ids=skill_ids).model_dump_json())
+    partial.replace(path)
 
 
 async def load_courses(session, args: argparse.Namespace) -> list[CourseRow]:  # type: ignore[no-untyped-def]
     """Courses to map: a single targeted course, or all that lack course_skills rows."""
-    statement = select(Course)
+    statement = select(Course.id, Course.external_id, Course.title, Course.description)
     if args.course_id:
         values = [v.strip() for v in args.course_id.split(",") if v.strip()]
         statement = statement.where(or_(*[_course_id_filter(v) for v in values]))
@@ -164,8 +386,8 @@ async def load_courses(session, args: argparse.Namespace) -> list[CourseRow]:  #
     if args.limit is not None:
         statement = statement.limit(args.limit)
 
-    rows = (await session.scalars(statement)).all()
-    return [CourseRow(c.id, c.external_id, c.title, c.description) for c in rows]
+    rows = (await session.execute(statement)).all()
+    return [CourseRow(*row) for row in rows]
 
 
 def _course_id_filter(value: str):  # type: ignore[no-untyped-def]
@@ -179,29 +401,42 @@ def _course_id_filter(value: str):  # type: ignore[no-untyped-def]
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
 async def map_course(client: AsyncOpenAI, system_prompt: str, course: CourseRow) -> list[str]:
     """Ask the model which skills the course teaches; return the raw id list."""
-    user_prompt = f"Course title: {course.title}\nCourse description: {course.description or ''}"
-    response = await client.chat.completions.create(
-        model=MODEL,
-        temperature=0,
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ],
-    )
-    content = response.choices[0].message.content or "{}"
     try:
-        data = json.loads(content)
-    except json.JSONDecodeError:
-        return []
-    skill_ids = data.get("skill_ids", [])
-    if not isinstance(skill_ids, list):
-        return []
-    return [s for s in skill_ids if isinstance(s, str)]
+        response = await client.chat.completions.parse(
+            **_request_params(system_prompt, course), response_format=SkillIdsReply
+        )
+    except (LengthFinishReasonError, ContentFilterFinishReasonError):
+        return []  # cut off or filtered — treat as "nothing confidently taught"
+    reply = response.choices[0].message.parsed
+    return reply.skill_ids if reply is not None else []  # None: the model refused
+
+
+def _request_params(system_prompt: str, course: CourseRow) -> dict:
+    """The request fields shared by the realtime call and a --batch line."""
+    user_prompt = f"Course title: {course.title}\nCourse description: {course.description or ''}"
+    messages: list[ChatCompletionMessageParam] = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
+    return {
+        "model": MODEL,
+        "temperature": 0,
+        "max_tokens": MAX_OUTPUT_TOKENS,
+        "prompt_cache_key": PROMPT_CACHE_KEY,
+        "messages": messages,
+    }
 
 
 async def replace_course_skills(session, course_id: uuid.UUID, skill_ids: list[str]) -> None:  # type: ignore[no-untyped-def]
-    """Replace a course's skill rows (delete then insert) so re-runs are idempotent."""
+    """Replace a course's skill rows (delete then insert) so re-runs are idempotent.
+
+    Each course is its own transaction, and this one skips waiting for the WAL flush
+    at commit. A crash can then lose the last few commits, but a course without
+    course_skills rows is simply picked up again by the next run (from the reply
+    cache, so for free) — while a cached re-run no longer pays one disk sync per
+    course.
+    """
+    await session.execute(text("SET LOCAL synchronous_commit TO OFF"))
     await session.execute(delete(CourseSkill).where(CourseSkill.course_id == course_id))
     for skill_id in skill_ids:
         session.add(CourseSkill(course_id=course_id, skill_id=skill_id))
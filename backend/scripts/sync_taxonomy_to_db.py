@@ -37,8 +37,15 @@ async def run() -> None:
     async with sessionmaker() as session:
         skill_count, alias_count = await sync(session)
         await session.commit()
-        db_skills = await session.scalar(select(func.count()).select_from(Skill))
-        db_aliases = await session.scalar(select(func.count()).select_from(SkillAlias))
+        # Both exact counts in one round trip. Exact, not estimated from the planner
+        # statistics: this line exists to verify the sync, and the tables are ~1k rows.
+        counts = await session.execute(
+            select(
+                select(func.count()).select_from(Skill).scalar_subquery(),
+                select(func.count()).select_from(SkillAlias).scalar_subquery(),
+            )
+        )
+        db_skills, db_aliases = counts.one()
 
     print(f"synced {skill_count} skills, {alias_count} aliases from skills.json")
     print(f"table row counts now: skills={db_skills}, skill_aliases={db_aliases}")
@@ -5,7 +5,9 @@ app, scripts, and scrapers regardless of how pytest is invoked.
 """
 
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from types import ModuleType
 
 BACKEND_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(BACKEND_ROOT))
@@ -23,3 +25,19 @@ def _configure_observability() -> None:
     from app.observability import configure_observability
 
     configure_observability("skillbridge-test")
+
+
+@pytest.fixture
+def forbid_db(monkeypatch: pytest.MonkeyPatch) -> Callable[[ModuleType], None]:
+    """Make a step module's get_sessionmaker fail the test if it is ever called.
+
+    For steps that must short-circuit before opening a session on empty input.
+    """
+
+    def _forbid(module: ModuleType) -> None:
+        def no_db() -> None:
+            raise AssertionError(f"{module.__name__} must not open a session here")
+
+        monkeypatch.setattr(module, "get_sessionmaker", no_db)
+
+    return _forbid
@@ -165,6 +165,20 @@ async def test_patch_add_and_remove_manual_skills(sessionmaker_, fake_redis) ->
         assert removed.json()["skills_by_category"] == {"devops": ["docker"]}
 
 
+async def test_patch_add_tolerates_repeated_and_existing_ids(sessionmaker_, fake_redis) -> None:  # type: ignore[no-untyped-def]
+    async with sessionmaker_() as session:
+        user = await make_user(session, "repeat", [("python", "extracted")])
+
+    async with await signed_in_client(sessionmaker_, fake_redis, user) as client:
+        response = await client.patch("/dashboard", json={"add": ["docker", "docker", "python"]})
+
+    assert response.status_code == 200
+    assert response.json()["skills_by_category"] == {
+        "devops": ["docker"],
+        "language": ["python"],
+    }
+
+
 async def test_patch_unknown_skill_id_is_rejected(sessionmaker_, fake_redis) -> None:  # type: ignore[no-untyped-def]
     async with sessionmaker_() as session:
         user = await make_user(session, "unknown", [])
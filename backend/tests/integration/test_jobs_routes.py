@@ -149,6 +149,24 @@ async def test_ranking_matched_missing_and_per_user_scoping(sessionmaker_, fake_
     assert {s["id"] for s in py_for_bob["missing_skills"]} == {"python", "fastapi"}
 
 
+async def test_user_without_skills_gets_freshest_first(sessionmaker_, fake_redis) -> None:  # type: ignore[no-untyped-def]
+    async with sessionmaker_() as session:
+        await seed_skill(session, "python")
+        await session.commit()
+        user = await make_user(session, "fresh-user", [])
+        older = await make_job(session, "older", ["python"], days_ago=3)
+        newer = await make_job(session, "newer", [], days_ago=1)
+
+    async with await signed_in_client(sessionmaker_, fake_redis, user) as client:
+        returned = [
+            j for j in (await client.get("/jobs")).json() if j["id"] in (str(older), str(newer))
+        ]
+
+    assert [j["id"] for j in returned] == [str(newer), str(older)]
+    assert all(j["overlap"] == 0 and j["matched_skills"] == [] for j in returned)
+    assert {s["id"] for s in returned[1]["missing_skills"]} == {"python"}
+
+
 async def test_pagination(sessionmaker_, fake_redis) -> None:  # type: ignore[no-untyped-def]
     async with sessionmaker_() as session:
         await seed_skill(session, "python")
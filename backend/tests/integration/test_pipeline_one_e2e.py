@@ -36,6 +36,7 @@ from moto import mock_aws  # noqa: E402
 orchestrator = importlib.import_module("app.pipeline_one")
 step01 = importlib.import_module("app.pipeline_one.01_ingest")
 step02 = importlib.import_module("app.pipeline_one.02_extract_text")
+step07 = importlib.import_module("app.pipeline_one.07_generate_projects")
 step07_logic = importlib.import_module("app.pipeline_one.07_generate_projects.logic")
 step08_logic = importlib.import_module("app.pipeline_one.08_persist.logic")
 
@@ -139,6 +140,9 @@ async def test_full_run_completes_and_writes_a_plan(sessionmaker_, moto_r2, monk
         return QUERY_VECTOR
 
     monkeypatch.setattr(retriever, "embed_text", fake_embed)
+    monkeypatch.setattr(step07_logic, "embed_text", fake_embed)  # the project cache lookup
+    project_cache = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(step07, "get_redis_client", lambda: project_cache)
 
     async def fake_chat(messages, *, model, temperature=0.7, max_tokens=None, run_id=None):  # type: ignore[no-untyped-def]
         is_skillbridge = "BOTH sets together" in messages[0]["content"]
@@ -209,7 +213,7 @@ async def test_failing_step_marks_the_run_failed(sessionmaker_, monkeypatch) ->
 
 
 def _mock_openai_and_r2(monkeypatch, moto_r2) -> None:  # type: ignore[no-untyped-def]
-    """Shared mocks: R2 (steps 01/02), embeddings (retrieve), chat (generate)."""
+    """Shared mocks: R2 (steps 01/02), embeddings (retrieve, project cache), chat (generate)."""
     monkeypatch.setattr(step01, "get_r2", lambda: moto_r2)
     monkeypatch.setattr(step02, "get_r2", lambda: moto_r2)
 
@@ -217,6 +221,9 @@ def _mock_openai_and_r2(monkeypatch, moto_r2) -> None:  # type: ignore[no-untype
         return QUERY_VECTOR
 
     monkeypatch.setattr(retriever, "embed_text", fake_embed)
+    monkeypatch.setattr(step07_logic, "embed_text", fake_embed)  # the project cache lookup
+    project_cache = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(step07, "get_redis_client", lambda: project_cache)
 
     async def fake_chat(messages, *, model, temperature=0.7, max_tokens=None, run_id=None):  # type: ignore[no-untyped-def]
         is_skillbridge = "BOTH sets together" in messages[0]["content"]
@@ -0,0 +1,57 @@
+"""Semantic cache tests — similarity threshold, partitions, and the entry cap (fakeredis)."""
+
+from collections.abc import AsyncIterator
+
+import fakeredis.aioredis
+import pytest
+
+from app.llm import semantic_cache
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[fakeredis.aioredis.FakeRedis]:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield fake
+    await fake.aclose()
+
+
+async def test_near_identical_embedding_hits(client: fakeredis.aioredis.FakeRedis) -> None:
+    await semantic_cache.remember(client, "p", [1.0, 0.0, 0.0], {"answer": 42})
+
+    assert await semantic_cache.find_similar(client, "p", [0.99, 0.05, 0.0]) == {"answer": 42}
+
+
+async def test_dissimilar_embedding_misses(client: fakeredis.aioredis.FakeRedis) -> None:
+    await semantic_cache.remember(client, "p", [1.0, 0.0, 0.0], {"answer": 42})
+
+    assert await semantic_cache.find_similar(client, "p", [0.7, 0.7, 0.0]) is None
+
+
+async def test_partitions_never_share_entries(client: fakeredis.aioredis.FakeRedis) -> None:
+    await semantic_cache.remember(client, "p", [1.0, 0.0], {"answer": 42})
+
+    assert await semantic_cache.find_similar(client, "other", [1.0, 0.0]) is None
+
+
+async def test_most_similar_entry_wins(client: fakeredis.aioredis.FakeRedis) -> None:
+    await semantic_cache.remember(client, "p", [1.0, 0.1], {"answer": "close"})
+    await semantic_cache.remember(client, "p", [1.0, 0.0], {"answer": "exact"})
+    await semantic_cache.remember(client, "p", [1.0, 0.2], {"answer": "closeish"})
+
+    assert await semantic_cache.find_similar(client, "p", [1.0, 0.0]) == {"answer": "exact"}
+
+
+async def test_partition_keeps_only_the_newest_entries(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    for index in range(semantic_cache.MAX_ENTRIES_PER_PARTITION + 5):
+        await semantic_cache.remember(client, "p", [1.0, float(index)], {"index": index})
+
+    key = "semantic_cache:p"
+    assert await client.llen(key) == semantic_cache.MAX_ENTRIES_PER_PARTITION
+    assert 0 < await client.ttl(key) <= semantic_cache.CACHE_TTL_SECONDS
+
+
+def test_partition_key_depends_on_every_part() -> None:
+    assert semantic_cache.partition_key(["a", "b"]) == semantic_cache.partition_key(["a", "b"])
+    assert semantic_cache.partition_key(["a", "b"]) != semantic_cache.partition_key(["a", "c"])
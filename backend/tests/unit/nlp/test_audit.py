@@ -75,3 +75,12 @@ def test_empty_directory_is_graceful(tmp_path: Path) -> None:
     assert report["total_matches"] == 0
     assert report["matches_by_category"] == {}
     assert report["candidate_gaps"] == []
+
+
+def test_parallel_scan_matches_serial(tmp_path: Path) -> None:
+    write_files(tmp_path)
+    (tmp_path / "only.txt").write_text("A prototype in SoloLangABC nobody else uses.")
+
+    serial = audit.scan_directory(tmp_path, min_files=1)
+    parallel = audit.scan_directory(tmp_path, min_files=1, workers=2)
+    assert parallel == serial
@@ -32,3 +32,12 @@ async def test_retrieve_stores_candidate_ids(course_seeder, db_sessionmaker, mon
     ids = set(result.retrieved_course_ids)
     assert course_a in ids and course_b in ids  # distance 0 -> guaranteed in top-50
     assert len(result.retrieved_course_ids) <= 50
+
+
+async def test_empty_gap_skips_embedding_and_db(forbid_db) -> None:  # type: ignore[no-untyped-def]
+    forbid_db(retrieve_step)
+
+    state = PipelineState(run_id=uuid.uuid4(), jd_text="jd", missing_ids=[])
+    result = await retrieve_step.run(state)
+
+    assert result.retrieved_course_ids == []
@@ -113,3 +113,15 @@ async def test_run_over_seeded_db(course_seeder, db_sessionmaker, monkeypatch) -
     assert result.course_b_id == course_x
     assert result.course_a_covered == ["docker", "fastapi"]
     assert result.course_b_covered == ["python"]
+
+
+async def test_run_without_candidates_skips_db(forbid_db) -> None:  # type: ignore[no-untyped-def]
+    forbid_db(select_step)
+
+    state = PipelineState(
+        run_id=uuid.uuid4(), jd_text="jd", missing_ids=[], retrieved_course_ids=[]
+    )
+    result = await select_step.run(state)
+
+    assert result.course_a_id is None and result.course_b_id is None
+    assert result.course_a_covered == [] and result.course_b_covered == []
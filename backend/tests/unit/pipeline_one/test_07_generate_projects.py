@@ -2,12 +2,14 @@
 
 The LLM client is mocked, so no OpenAI is called. A fake `chat` inspects the prompt
 it receives to decide which of the two projects it is and returns tagged Markdown.
+The semantic cache is off unless a test passes a fakeredis client in explicitly.
 """
 
 import asyncio
 import importlib
 import uuid
 
+import fakeredis.aioredis
 import pytest
 
 from app.common.errors import PipelineStepError
@@ -22,6 +24,11 @@ COURSE_COVERED = ["rag", "vector-search"]  # -> "RAG", "Vector Search"
 JD = "Build and ship backend APIs."
 
 
+@pytest.fixture(autouse=True)
+def no_project_cache(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.setattr(projects_step, "get_redis_client", lambda: None)
+
+
 def result_with(text: str) -> ChatResult:
     return ChatResult(
         text=text, model="gpt-4o", prompt_tokens=100, completion_tokens=200, cost_usd=0.0
@@ -65,6 +72,27 @@ async def test_renders_prompts_with_the_right_variables(monkeypatch) -> None:  #
     assert result.project_two_md == "skillbridge"
 
 
+def test_jd_layout_whitespace_is_compacted() -> None:
+    pasted = "  Responsibilities:\r\n\n\n\n\t-   Build   APIs  \n  - Ship\t\tfast  \n\n"
+    compacted = projects_logic.compact_whitespace(pasted)
+    assert compacted == "Responsibilities:\n\n- Build APIs\n- Ship fast"
+
+
+async def test_overlong_jd_is_capped_in_the_prompt(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    seen: list[str] = []
+
+    async def fake_chat(messages, **_kwargs) -> ChatResult:  # type: ignore[no-untyped-def]
+        seen.append(messages[0]["content"])
+        return result_with("project")
+
+    monkeypatch.setattr(projects_logic, "chat", fake_chat)
+
+    head = "x" * projects_logic.MAX_JD_CHARS
+    await projects_logic.generate_projects(MATCHED, head + "TAIL_BOILERPLATE", COURSE_COVERED)
+
+    assert all(head in prompt and "TAIL_BOILERPLATE" not in prompt for prompt in seen)
+
+
 async def test_the_two_calls_run_in_parallel(monkeypatch) -> None:  # type: ignore[no-untyped-def]
     both_started = asyncio.Event()
     started = 0
@@ -136,3 +164,55 @@ async def test_run_threads_projects_onto_state(monkeypatch) -> None:  # type: ig
 
     assert new_state.project_one_md == "fast-apply"
     assert new_state.project_two_md == "skillbridge"
+
+
+async def test_near_identical_jd_reuses_cached_projects(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    calls = 0
+
+    async def fake_chat(
+        messages, *, model, temperature=0.7, max_tokens=None, run_id=None
+    ) -> ChatResult:  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        return result_with("skillbridge" if is_skillbridge_prompt(messages) else "fast-apply")
+
+    embedded: list[str] = []
+
+    async def fake_embed(text: str) -> list[float]:
+        embedded.append(text)
+        # A near-duplicate JD (one extra word) lands close to, not on, the original.
+        return [1.0, 0.01] if text.endswith("Remote.") else [1.0, 0.0]
+
+    monkeypatch.setattr(projects_logic, "chat", fake_chat)
+    monkeypatch.setattr(projects_logic, "embed_text", fake_embed)
+    cache = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    first = await projects_logic.generate_projects(MATCHED, JD, COURSE_COVERED, cache=cache)
+    again = await projects_logic.generate_projects(
+        MATCHED, JD + " Remote.", COURSE_COVERED, cache=cache
+    )
+    other_gap = await projects_logic.generate_projects(MATCHED, JD, ["docker"], cache=cache)
+
+    assert again == first
+    assert embedded[1] == JD + " Remote."  # the near-duplicate text reached the cache
+    assert calls == 4  # two for the first request, two for the different course skills
+    assert other_gap.project_two_md == "skillbridge"
+
+
+async def test_cache_failure_falls_back_to_generating(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    async def fake_chat(
+        messages, *, model, temperature=0.7, max_tokens=None, run_id=None
+    ) -> ChatResult:  # type: ignore[no-untyped-def]
+        return result_with("skillbridge" if is_skillbridge_prompt(messages) else "fast-apply")
+
+    async def failing_embed(text: str) -> list[float]:
+        raise RuntimeError("embeddings down")
+
+    monkeypatch.setattr(projects_logic, "chat", fake_chat)
+    monkeypatch.setattr(projects_logic, "embed_text", failing_embed)
+    cache = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    result = await projects_logic.generate_projects(MATCHED, JD, COURSE_COVERED, cache=cache)
+
+    assert result.project_one_md == "fast-apply"
+    assert await cache.keys("semantic_cache:*") == []
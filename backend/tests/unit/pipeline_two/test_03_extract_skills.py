@@ -16,6 +16,8 @@ def test_extracts_skills_from_html_content(make_posting) -> None:  # type: ignor
 
     covered = set(result.skills_by_job["test-acme/1"])
     assert {"python", "fastapi", "docker"} <= covered
+    # The stripped text is handed on, so step 04 stores it without re-parsing the HTML.
+    assert result.text_by_job["test-acme/1"] == "We use Python and FastAPI & Docker."
 
 
 def test_posting_with_no_known_skills_gets_empty_list(make_posting) -> None:  # type: ignore[no-untyped-def]
@@ -27,3 +29,23 @@ def test_posting_with_no_known_skills_gets_empty_list(make_posting) -> None:  #
 
     # Not an error — the posting is still stored, just with no skills.
     assert result.skills_by_job["test-acme/2"] == []
+
+
+def test_identical_content_is_matched_once(make_posting, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    content = "<p>Python and Docker.</p>"
+    postings = [
+        make_posting(company="test-acme", gh_job_id=str(n), content=content) for n in range(3)
+    ]
+    calls: list[str] = []
+    real_extract = extract_logic.extract_skill_ids
+
+    def counting_extract(text: str) -> set[str]:
+        calls.append(text)
+        return real_extract(text)
+
+    monkeypatch.setattr(extract_logic, "extract_skill_ids", counting_extract)
+
+    result = extract_logic.extract(postings)
+
+    assert len(calls) == 1
+    assert all(result.skills_by_job[f"test-acme/{n}"] == ["docker", "python"] for n in range(3))
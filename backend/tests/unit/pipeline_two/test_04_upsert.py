@@ -24,6 +24,7 @@ async def test_upsert_writes_posting_and_skills(
         companies=["test-up"],
         filtered=[posting],
         skills_by_job={"test-up/1": ["python", "fastapi"]},
+        text_by_job={"test-up/1": "Python FastAPI"},
     )
 
     new_state = await upsert_step.run(state)
@@ -33,7 +34,7 @@ async def test_upsert_writes_posting_and_skills(
         job = (
             await session.scalars(select(JobPosting).where(JobPosting.company == "test-up"))
         ).one()
-        assert job.jd_text == "Python FastAPI"  # HTML stripped
+        assert job.jd_text == "Python FastAPI"  # step 03's stripped text
         skills = (await session.scalars(select(JobSkill).where(JobSkill.job_id == job.id))).all()
         assert {row.skill_id for row in skills} == {"python", "fastapi"}
 
@@ -50,7 +51,10 @@ async def test_reupsert_refreshes_row_and_replaces_skills(
     )
     await upsert_step.run(
         JobsRefreshState(
-            companies=["x"], filtered=[first], skills_by_job={"test-up2/9": ["python"]}
+            companies=["x"],
+            filtered=[first],
+            skills_by_job={"test-up2/9": ["python"]},
+            text_by_job={"test-up2/9": "Python"},
         )
     )
     second = make_posting(
@@ -58,7 +62,10 @@ async def test_reupsert_refreshes_row_and_replaces_skills(
     )
     await upsert_step.run(
         JobsRefreshState(
-            companies=["x"], filtered=[second], skills_by_job={"test-up2/9": ["docker"]}
+            companies=["x"],
+            filtered=[second],
+            skills_by_job={"test-up2/9": ["docker"]},
+            text_by_job={"test-up2/9": "Docker"},
         )
     )
 
@@ -72,3 +79,37 @@ async def test_reupsert_refreshes_row_and_replaces_skills(
             await session.scalars(select(JobSkill).where(JobSkill.job_id == jobs[0].id))
         ).all()
         assert {row.skill_id for row in skills} == {"docker"}  # fully replaced
+
+
+async def test_repeated_posting_in_one_cycle_is_written_once(
+    db_sessionmaker, ensure_skill, make_posting, monkeypatch
+) -> None:  # type: ignore[no-untyped-def]
+    await ensure_skill("python")
+    monkeypatch.setattr(upsert_step, "get_sessionmaker", lambda: db_sessionmaker)
+
+    stale = make_posting(company="test-up3", gh_job_id="5", title="Stale", content="<p>x</p>")
+    fresh = make_posting(company="test-up3", gh_job_id="5", title="Fresh", content="<p>x</p>")
+    state = JobsRefreshState(
+        companies=["test-up3"],
+        filtered=[stale, fresh],
+        skills_by_job={"test-up3/5": ["python"]},
+        text_by_job={"test-up3/5": "Python"},
+    )
+
+    new_state = await upsert_step.run(state)
+
+    assert new_state.upserted_count == 1
+    async with db_sessionmaker() as session:
+        jobs = (
+            await session.scalars(select(JobPosting).where(JobPosting.company == "test-up3"))
+        ).all()
+        assert [job.title for job in jobs] == ["Fresh"]  # last occurrence wins
+
+
+async def test_no_postings_skips_the_db(forbid_db) -> None:  # type: ignore[no-untyped-def]
+    forbid_db(upsert_step)
+    state = JobsRefreshState(companies=["test-up"], filtered=[], skills_by_job={}, text_by_job={})
+
+    new_state = await upsert_step.run(state)
+
+    assert new_state.upserted_count == 0
@@ -28,6 +28,7 @@ def test_construct_with_companies_leaves_derived_fields_none() -> None:
     assert state.fetched is None
     assert state.filtered is None
     assert state.skills_by_job is None
+    assert state.text_by_job is None
     assert state.upserted_count is None
     assert state.purged_count is None
 